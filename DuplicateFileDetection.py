@@ -1,10 +1,11 @@
 
 import datetime
 import hashlib
+import itertools
 import json
 import logging
+import mmap
 import os
-import pillow_heif  # https://github.com/bigcat88/pillow_heif
 import shutil
 import sqlite3
 import sys
@@ -14,6 +15,13 @@ from PIL import Image, UnidentifiedImageError
 from PIL.ExifTags import TAGS
 from tqdm import tqdm
 
+try:
+    import xxhash  # Optional: https://github.com/ifduyue/python-xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+    XXHASH_AVAILABLE = False
+
 import utils
 from photo_filter import PhotoFilter
 import constants
@@ -23,6 +31,10 @@ import constants
 # Configure logging using shared utility
 logger = utils.setup_logger(__name__, "DuplicateFileDetection_app_error.log")
 
+# Reverse index of the EXIF date tags we read (e.g. "DateTimeOriginal" -> 36867).
+# Built once at import instead of inverting the full PIL TAGS dict for every file.
+_DATE_TAG_IDS = {name: tag_id for tag_id, name in TAGS.items() if name.startswith("DateTime")}
+
 
 class PhotoDatabase:
     """
@@ -56,6 +68,7 @@ class PhotoDatabase:
         try:
             self.conn = sqlite3.connect(self.database_path)
             self.cursor = self.conn.cursor()
+            self._apply_pragmas()
             logger.debug(f"Database connection opened to {self.database_path}")
             return self
         except Exception as e:
@@ -92,6 +105,58 @@ class PhotoDatabase:
         # Return False to propagate exceptions
         return False
 
+    def _apply_pragmas(self):
+        """
+        Tune the connection for bulk inserts.
+
+        WAL journaling with synchronous=NORMAL only fsyncs at checkpoints instead of
+        on every commit, so the periodic batch commits in find_duplicates stay cheap.
+        Temp tables live in memory and the database file is memory-mapped for reads.
+        """
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        self.cursor.execute("PRAGMA temp_store=MEMORY")
+        self.cursor.execute(f"PRAGMA mmap_size={constants.SQLITE_MMAP_SIZE}")
+
+    def get_hash_algorithm(self):
+        """
+        Return the content hash algorithm used by this database, recording it on first use.
+
+        Databases that already contain photos were built with SHA-256 and keep it, so their
+        stored hashes stay comparable. A new, empty database uses xxh3_128 when the xxhash
+        package is installed, otherwise SHA-256.
+
+        Returns:
+            str: constants.HASH_ALGORITHM_SHA256 or constants.HASH_ALGORITHM_XXH3
+        """
+        try:
+            self.cursor.execute("CREATE TABLE IF NOT EXISTS HashSettings (algorithm TEXT NOT NULL)")
+            self.cursor.execute("SELECT algorithm FROM HashSettings LIMIT 1")
+            row = self.cursor.fetchone()
+            if row:
+                return row[0]
+
+            self.cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'UniquePhotos'"
+            )
+            has_photos = False
+            if self.cursor.fetchone():
+                self.cursor.execute("SELECT 1 FROM UniquePhotos LIMIT 1")
+                has_photos = self.cursor.fetchone() is not None
+
+            if XXHASH_AVAILABLE and not has_photos:
+                algorithm = constants.HASH_ALGORITHM_XXH3
+            else:
+                algorithm = constants.HASH_ALGORITHM_SHA256
+
+            self.cursor.execute("INSERT INTO HashSettings (algorithm) VALUES (?)", (algorithm,))
+            self.conn.commit()
+            logger.info(f"Recorded hash algorithm '{algorithm}' for {self.database_path}")
+            return algorithm
+        except Exception as e:
+            logger.exception(f"Failed to determine hash algorithm: {e}")
+            raise
+
     def connection(self):
         """Get the database connection object."""
         return self.conn
@@ -106,7 +171,7 @@ class PhotoDatabase:
         This should be called after entering the context.
 
         Schema includes:
-        - file_hash: Full SHA-256 hash (PRIMARY KEY)
+        - file_hash: Full content hash (PRIMARY KEY, algorithm per get_hash_algorithm)
         - partial_hash: Hash of first N bytes (for quick lookup)
         - partial_hash_bytes: Number of bytes used for partial hash
         - file_size: File size in bytes
@@ -175,6 +240,25 @@ class PhotoDatabase:
             logger.exception(f"Failed to retrieve hashes from database: {e}")
             raise
 
+    def get_all_file_sizes(self):
+        """
+        Retrieve the distinct file sizes stored in the UniquePhotos table.
+
+        Returns:
+            set or None: Set of file sizes in bytes, or None if any row has no recorded
+                         size (a size lookup could then miss a duplicate)
+        """
+        try:
+            self.cursor.execute("SELECT 1 FROM UniquePhotos WHERE file_size IS NULL LIMIT 1")
+            if self.cursor.fetchone():
+                logger.info("Some stored photos have no file size - size-first check disabled")
+                return None
+            self.cursor.execute("SELECT DISTINCT file_size FROM UniquePhotos")
+            return {row[0] for row in self.cursor.fetchall()}
+        except Exception as e:
+            logger.exception(f"Failed to retrieve file sizes from database: {e}")
+            raise
+
     def insert_unique_photo(self, file_hash, file_path, create_datetime, create_year, create_month, create_day,
                            partial_hash=None, partial_hash_bytes=None, file_size=None):
         """
@@ -268,6 +352,8 @@ def get_file_list(sources, recursive=False, file_endings=None, progress_callback
     """
     Create a list all files in the source directory, and subdirectories if the recursive parameter is true.
 
+    This materializes iter_file_list() for callers that need the total count up front (e.g. the GUI).
+
     Parameters:
     source (list of strings that contain valid directory path): The source directory path.
     recursive (bool): If True, list files recursively. Default is False.
@@ -280,64 +366,126 @@ def get_file_list(sources, recursive=False, file_endings=None, progress_callback
     """
     try:
         logger.info("Initializing get_file_list")
-        file_list = []
-        logger.info(f"The list of directories passed = {sources}")
         if not sources:
             logger.info(f"There were no sources passed!")
             return None
 
-        # Progress bar for scanning directories
-        with tqdm(total=len(sources), desc="Scanning directories", unit="dir") as pbar:
-            for idx, source in enumerate(sources):
-                pbar.set_postfix_str(os.path.basename(source)[:constants.MAX_FILENAME_DISPLAY_LENGTH_SCAN])
+        file_list = list(iter_file_list(sources, recursive, file_endings, progress_callback))
+        logger.info("Completed processing all sources passed!")
+        return file_list
+    except Exception as e:
+        logger.exception(f"\n list_files process Failed : { sys.exc_info()} - {e}")
 
-                # Progress callback for GUI
-                if progress_callback:
-                    progress_callback(idx + 1, len(sources), source)
 
-                try:
-                    logger.info(f"Processing the source = {source}")
-                    if recursive:
-                        logger.info(f"Recursively processing {source}")
-                        for root, dirs, files in os.walk(source):
-                            logger.info(f"Processing root = {root}, and Subdirectories = {dirs}.")
-                            files_processed_count = 0
-                            files_added_count = 0
-                            for file in files:
-                                logger.info(f"Processing file {file} in {root}/{dirs}")
-                                files_processed_count = files_processed_count + 1
-                                verified_filename = VerifyFileType(os.path.join(root, file))
-                                if verified_filename:
-                                    logger.info(f"Processing file {verified_filename}")
-                                    if not file_endings or verified_filename.lower().endswith(tuple(file_endings)):
-                                        file_list.append(os.path.join(root, verified_filename))
-                                        files_added_count = files_added_count + 1
-                                        logger.info(f"appended - {verified_filename} to file_list")
-                                    else:
-                                        logger.info("hmmmm")
-                                else:
-                                    logger.info(f"The verifyfiletype routine determined that the file is not a valid type!")
+def iter_file_list(sources, recursive=False, file_endings=None, progress_callback=None):
+    """
+    Yield the files in the source directories, and subdirectories if the recursive parameter is true.
+
+    Files are yielded as soon as they are found, so find_duplicates can start hashing before
+    the whole tree has been scanned and the full list never has to be held in memory.
+
+    Parameters:
+    sources (list of strings that contain valid directory path): The source directory paths.
+    recursive (bool): If True, list files recursively. Default is False.
+    file_endings (list): List of file endings/extensions to include. Default is None.
+    progress_callback (callable): Optional callback function(dirs_scanned, total_dirs, current_dir) for progress updates.
+
+    Yields:
+    str: The path of each file found in the sources.
+    """
+    logger.info(f"The list of directories passed = {sources}")
+    if not sources:
+        logger.info(f"There were no sources passed!")
+        return
+
+    # Normalize once to a lowercase set so each file costs one splitext and one hash lookup
+    endings = frozenset(ending.lower() for ending in file_endings) if file_endings else None
 
-                            logger.debug(f"Processed {files_processed_count } and Added {files_added_count} files from {root}/{dirs} to the list to process.")
+    # Progress bar for scanning directories
+    with tqdm(total=len(sources), desc="Scanning directories", unit="dir") as pbar:
+        for idx, source in enumerate(sources):
+            pbar.set_postfix_str(os.path.basename(source)[:constants.MAX_FILENAME_DISPLAY_LENGTH_SCAN])
+
+            # Progress callback for GUI
+            if progress_callback:
+                progress_callback(idx + 1, len(sources), source)
+
+            try:
+                logger.info(f"Processing the source = {source}")
+                files_added_count = 0
+                if recursive:
+                    logger.info(f"Recursively processing {source}")
+                    for file_path in _scan_tree(source, endings):
+                        files_added_count = files_added_count + 1
+                        yield file_path
+                else:
+                    logger.info(f"EXCLUSIVELY processing {source}")
+                    with os.scandir(source) as entries:
+                        for entry in entries:
+                            if entry.is_file() and (
+                                not endings or os.path.splitext(entry.name)[1].lower() in endings
+                            ):
+                                files_added_count = files_added_count + 1
+                                yield entry.path
+                logger.debug(f"Added {files_added_count} files from {source} to the list to process.")
+
+            except Exception as e:
+                logger.exception(f"\n Processing the source = {source} Failed : {sys.exc_info()} - {e}")
+            pbar.update(1)
+
+
+def _scan_tree(source, file_endings=None):
+    """
+    Recursively yield verified files below source using os.scandir.
+
+    os.scandir returns the entry type with the directory listing, so unlike os.walk no extra
+    stat call is needed per entry to tell files from directories. Directories are visited
+    top-down, and each directory's listing is closed before its files are verified, because
+    VerifyFileType may rename files in place.
+
+    Parameters:
+    source (str): The directory to scan.
+    file_endings (frozenset): Lowercase file endings to include, or None to include all files.
+
+    Yields:
+    str: The verified path of each matching file.
+    """
+    pending_dirs = [source]
+    while pending_dirs:
+        root = pending_dirs.pop()
+        file_names = []
+        sub_dirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_dirs.append(entry.path)
                     else:
-                        logger.info(f"EXCLUSIVELY processing {source}")
-                        with os.scandir(source) as entries:
-                            for entry in entries:
-                                if entry.is_file() and (
-                                    not file_endings or entry.name.lower().endswith(tuple(file_endings))
-                                ):
-                                    file_list.append(entry.path)
-                    logger.debug(f"Added {len(file_list)} files from {source} to the list to process.")
-                    pbar.update(1)
+                        file_names.append(entry.name)
+        except OSError as e:
+            logger.warning(f"Could not scan directory {root}: {e}")
+            continue
+
+        logger.info(f"Processing root = {root}, and Subdirectories = {sub_dirs}.")
+        files_processed_count = 0
+        files_added_count = 0
+        for file in file_names:
+            logger.info(f"Processing file {file} in {root}")
+            files_processed_count = files_processed_count + 1
+            verified_filename = VerifyFileType(os.path.join(root, file))
+            if verified_filename:
+                logger.info(f"Processing file {verified_filename}")
+                if not file_endings or os.path.splitext(verified_filename)[1].lower() in file_endings:
+                    files_added_count = files_added_count + 1
+                    logger.info(f"appended - {verified_filename} to file_list")
+                    yield verified_filename
+            else:
+                logger.info(f"The verifyfiletype routine determined that the file is not a valid type!")
 
-                except Exception as e:
-                    logger.exception(f"\n Processing the source = {source} Failed : {sys.exc_info()} - {e}")
-                    pbar.update(1)
+        logger.debug(f"Processed {files_processed_count } and Added {files_added_count} files from {root} to the list to process.")
 
-        logger.info("Completed processing all sources passed!")
-        return file_list
-    except Exception as e:
-        logger.exception(f"\n list_files process Failed : { sys.exc_info()} - {e}")
+        # Reverse so the stack pops subdirectories in listing order
+        pending_dirs.extend(reversed(sub_dirs))
 
 
 def get_creation_date(file_path):
@@ -362,14 +510,10 @@ def get_creation_date(file_path):
         #pillow_heif.register_heif_opener()
 
         if os.name == "nt":  # Windows
-            # get the creation date/time from Windows - This is stored as a ???
-            try:
-                creation_time = os.path.getctime(file_path)
-            except Exception as e:
-                logger.exception(f"The getctime function failure {e} occurred for file {file_path}")
-
-            mod_time = os.path.getmtime(file_path)  # usually the modification date is a better indicator of the actual creation date.
-            creation_date = datetime.datetime.fromtimestamp(creation_time)
+            # get the creation date/time from Windows - one stat provides both the creation and modification times
+            stat = os.stat(file_path)
+            creation_time = stat.st_ctime
+            mod_time = stat.st_mtime  # usually the modification date is a better indicator of the actual creation date.
             creation_date = datetime.datetime.fromtimestamp(mod_time)
             extension = os.path.splitext(file_path)[1]
             logger.info(f"-- create_time = {creation_time}, creation_date = {creation_date}, extension = {extension}")
@@ -378,9 +522,6 @@ def get_creation_date(file_path):
                 processed_photos = 0
                 not_photos = 0
 
-                # TAGS is defined in PIL as a list of items returned
-                _TAGS_r = dict(((v, k) for k, v in TAGS.items()))
-
                 # logger.info(f"TAGS.items() = {TAGS.items()}")
                 #logger.info(f"The extension for file is {extension}, and the supported_extensions = {supported_extensions}")
                 if extension in supported_extensions:
@@ -401,18 +542,10 @@ def get_creation_date(file_path):
                             GPS Date time can be retrieved from the  GPSTAGS object if necessary.
                             GPSDateTime - 
                             '''
-                            logger.info(f"____________________   List of Date Tags ____________________________________ ")
-                            logger.info(f"_TAGS_r  for DateTimeOriginal = ")
-                            logger.info(_TAGS_r["DateTimeOriginal"])
-                            logger.info(_TAGS_r["Model"])
-                            # logger.info(_TAGS_r["CreateDate"])
-                            # logger.info(_TAGS_r["GPSDateTime"])
-                            # logger.info(_TAGS_r["DateTimeCreated"])
-                            logger.info(f"________________________________________________________ ")
                             if exif_data_PIL is not None:
-                                if exif_data_PIL[_TAGS_r["DateTimeOriginal"]]:
+                                fileDate = exif_data_PIL.get(_DATE_TAG_IDS["DateTimeOriginal"])
+                                if fileDate:
                                     # if a value for DateTimeOriginal is included in EXIF data, then use that as the fileDate.
-                                    fileDate = exif_data_PIL[_TAGS_r["DateTimeOriginal"]]
                                     logger.info(f"fileDate = {fileDate}")
                                     if fileDate != '' and len(fileDate) > 10 and fileDate != "0000:00:00 00:00:00":
                                         # we located a proper file date in the exif data, so use that instead of date from OS.
@@ -435,7 +568,7 @@ def get_creation_date(file_path):
                                     else:
                                         logger.info("fileDate does not exist in EXIF data.")
                                 else:
-                                    logger.info(f" exif_data_PIL[_TAGS_r[DateTimeOriginal]] does not exist.")
+                                    logger.info(f" exif_data_PIL[DateTimeOriginal] does not exist.")
                             else:
                                 not_photos += 1
                                 logger.info(f"No EXIF data was present.  \r{processed_photos} photos processed, {not_photos} not processed")
@@ -491,25 +624,55 @@ def get_creation_date(file_path):
         day = constants.INVALID_DATE_DAY
         return year, month, day
 
-def hash_file(filename):
+def _new_hasher(algorithm):
+    """
+    Create an empty hash object for the given algorithm.
+
+    Parameters:
+        algorithm (str): constants.HASH_ALGORITHM_SHA256 or constants.HASH_ALGORITHM_XXH3
+
+    Returns:
+        A hash object with update() and hexdigest()
+    """
+    if algorithm == constants.HASH_ALGORITHM_XXH3:
+        if not XXHASH_AVAILABLE:
+            raise RuntimeError("This database uses xxh3_128 hashes - install the xxhash package to use it")
+        return xxhash.xxh3_128()
+    return hashlib.sha256()
+
+
+def hash_file(filename, algorithm=constants.HASH_ALGORITHM_SHA256):
     """
-    Calculates the SHA-256 hash of an entire file.
+    Calculates the hash of an entire file.
 
     Parameters:
         filename (str): Path to the file to hash
+        algorithm (str): Hash algorithm (default: constants.HASH_ALGORITHM_SHA256)
 
     Returns:
-        str: Hexadecimal SHA-256 hash of the file
+        str: Hexadecimal hash of the file
     """
     try:
         logger.info(f"Initiating full hash for {filename}")
-        hasher = hashlib.sha256()
+        hasher = _new_hasher(algorithm)
         with open(filename, 'rb') as file:
-            while True:
-                chunk = file.read(constants.FILE_READ_CHUNK_SIZE)  # Read file in chunks
-                if not chunk:
-                    break
-                hasher.update(chunk)
+            fileno = file.fileno()
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fileno, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            if os.fstat(fileno).st_size >= constants.MMAP_HASH_MIN_FILE_SIZE:
+                # Hash the mapped pages directly - no per-chunk bytes objects are allocated
+                with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped_file:
+                    hasher.update(mapped_file)
+            elif hasattr(hashlib, "file_digest"):
+                # Python 3.11+: reads into a reusable buffer instead of allocating a chunk per read
+                hasher = hashlib.file_digest(file, lambda: hasher)
+            else:
+                while True:
+                    chunk = file.read(constants.FILE_READ_CHUNK_SIZE)  # Read file in chunks
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
         hash_result = hasher.hexdigest()
         logger.info(f"Full hash for {filename}: {hash_result}")
         return hash_result
@@ -519,9 +682,9 @@ def hash_file(filename):
         raise
 
 
-def hash_file_partial(filename, num_bytes=constants.PARTIAL_HASH_BYTES):
+def hash_file_partial(filename, num_bytes=constants.PARTIAL_HASH_BYTES, algorithm=constants.HASH_ALGORITHM_SHA256):
     """
-    Calculates the SHA-256 hash of the first N bytes of a file.
+    Calculates the hash of the first N bytes of a file.
 
     This is used as a quick preliminary check before hashing the entire file.
     If partial hashes don't match, files cannot be duplicates.
@@ -530,13 +693,14 @@ def hash_file_partial(filename, num_bytes=constants.PARTIAL_HASH_BYTES):
     Parameters:
         filename (str): Path to the file to hash
         num_bytes (int): Number of bytes from start of file to hash (default: 16KB)
+        algorithm (str): Hash algorithm (default: constants.HASH_ALGORITHM_SHA256)
 
     Returns:
-        str: Hexadecimal SHA-256 hash of first num_bytes of the file
+        str: Hexadecimal hash of first num_bytes of the file
     """
     try:
         logger.debug(f"Calculating partial hash ({num_bytes} bytes) for {filename}")
-        hasher = hashlib.sha256()
+        hasher = _new_hasher(algorithm)
         with open(filename, 'rb') as file:
             # Read only the first num_bytes
             chunk = file.read(num_bytes)
@@ -551,6 +715,83 @@ def hash_file_partial(filename, num_bytes=constants.PARTIAL_HASH_BYTES):
         raise
 
 
+def hash_file_with_partial(filename, num_bytes=constants.PARTIAL_HASH_BYTES, algorithm=constants.HASH_ALGORITHM_SHA256):
+    """
+    Calculates the full hash and the partial hash (first N bytes) of a file in one read.
+
+    For files that need both hashes stored but no partial hash lookup, this saves
+    hash_file_partial's separate open and read of the first num_bytes.
+
+    Parameters:
+        filename (str): Path to the file to hash
+        num_bytes (int): Number of bytes from start of file for the partial hash (default: 16KB)
+        algorithm (str): Hash algorithm (default: constants.HASH_ALGORITHM_SHA256)
+
+    Returns:
+        tuple: (full hash, partial hash) as hexadecimal strings
+    """
+    try:
+        logger.info(f"Initiating full and partial hash for {filename}")
+        hasher = _new_hasher(algorithm)
+        partial_hasher = _new_hasher(algorithm)
+        with open(filename, 'rb') as file:
+            fileno = file.fileno()
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fileno, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            if os.fstat(fileno).st_size >= constants.MMAP_HASH_MIN_FILE_SIZE:
+                # Hash the mapped pages directly - only the partial hash's head is copied
+                with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped_file:
+                    partial_hasher.update(mapped_file[:num_bytes])
+                    hasher.update(mapped_file)
+            else:
+                head = file.read(num_bytes)
+                partial_hasher.update(head)
+                hasher.update(head)
+                while True:
+                    chunk = file.read(constants.FILE_READ_CHUNK_SIZE)  # Read file in chunks
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+        hash_result = hasher.hexdigest()
+        partial_result = partial_hasher.hexdigest()
+        logger.info(f"Full hash for {filename}: {hash_result}")
+        logger.debug(f"Partial hash for {filename}: {partial_result}")
+        return hash_result, partial_result
+
+    except Exception as e:
+        logger.exception(f"The hash_file_with_partial routine failed - {e}")
+        raise
+
+
+def _photo_checked_files(files, photo_filter, batch_size=constants.FILTER_BATCH_SIZE):
+    """
+    Pair each file with its photo filter result, checking a batch of files at a time on a thread pool.
+
+    Parameters:
+    files (iterable): File paths to check. May be a generator from iter_file_list.
+    photo_filter (PhotoFilter): Enabled photo filter
+    batch_size (int): Number of files passed to each filter_batch call
+
+    Yields:
+    tuple: (file path, result) - result is True for a photo, False if filtered and None if the
+           path is not a regular file (non-files are never checked, so they stay out of the statistics)
+    """
+    iterator = iter(files)
+    try:
+        while True:
+            batch = list(itertools.islice(iterator, batch_size))
+            if not batch:
+                return
+            paths = [path for path in batch if os.path.isfile(path)]
+            results = dict(zip(paths, photo_filter.filter_batch(paths)))
+            for path in batch:
+                yield path, results.get(path)
+    finally:
+        # Every batch reused the filter's thread pool - shut it down once at the end
+        photo_filter.close()
+
+
 def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME, batch_size=constants.DEFAULT_BATCH_SIZE,
                    partial_hash_enabled=True, partial_hash_bytes=constants.PARTIAL_HASH_BYTES,
                    partial_hash_min_file_size=constants.PARTIAL_HASH_MIN_FILE_SIZE,
@@ -571,7 +812,9 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
         - Filtered files are tracked separately and not added to the database
 
         Parameters:
-        files - a list of files to be processed including the directory path to access the file
+        files - a list or iterator of files to be processed including the directory path to access the file.
+                An iterator (e.g. from iter_file_list) is consumed as it is produced, so hashing starts
+                before the scan completes; progress totals are then unknown until the end.
         hashes - a list of all previously located file hashes.
         database_path - path to the SQLite database file (default: constants.DEFAULT_DATABASE_NAME)
         batch_size - number of files to process before committing to database (default: constants.DEFAULT_BATCH_SIZE)
@@ -584,10 +827,13 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
         Returns:
             results - a dictionary containing:
                 duplicate_files - list of files that already exist in the database
-                original_files - list of new unique files that were added to database
+                original_files - list of new unique files that were added to database (file_hash, file_path,
+                                 file_create_datetime/year/month/day and file_size in bytes)
                 filtered_files - list of files that were filtered out (not real photos)
-                status - "completed" if successful
+                status - "completed" if successful, "failed" if the database cannot be used
+                error - reason the run failed (only when status is "failed")
                 files_processed - total number of files processed
+                original_bytes - total size in bytes of original_files
                 files_skipped - number of files skipped (already in DB from previous run)
                 filter_statistics - statistics about filtering (if enabled)
 
@@ -612,13 +858,21 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
         else:
             logger.info("hashes was not provided")
             hashes = []
+        # Set membership keeps the in-run duplicate check constant time
+        hashes = set(hashes)
 
         duplicate_files = []
         original_files = []
+        original_bytes = 0
         filtered_files = []
         files_processed = 0
         files_skipped = 0
         files_since_last_commit = 0
+        files_seen = 0
+
+        # A streamed iterator has no length; the running count is logged instead
+        total_files = len(files) if hasattr(files, '__len__') else None
+        total_display = total_files if total_files is not None else "?"
 
         # Initialize photo filter if config provided
         photo_filter = None
@@ -633,17 +887,51 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                 logger.warning(f"Failed to initialize PhotoFilter: {e}. Continuing without filtering.")
                 photo_filter = None
 
-        logger.info(f"Starting to process {len(files)} files with batch_size={batch_size}")
+        logger.info(f"Starting to process {total_display} files with batch_size={batch_size}")
+
+        # With filtering on, the photo checks for each batch of files run in parallel ahead of hashing
+        if photo_filter and photo_filter.enabled:
+            checked_files = _photo_checked_files(files, photo_filter)
+        else:
+            checked_files = ((filename, True if os.path.isfile(filename) else None) for filename in files)
 
         # Use the PhotoDatabase context manager
         with PhotoDatabase(database_path) as db:
+            # Hashes must be computed the same way as the ones already stored
+            hash_algorithm = db.get_hash_algorithm()
+            logger.info(f"Using {hash_algorithm} hashes for {database_path}")
+
+            # Without xxhash every file would fail to hash - stop the run with one error instead
+            if hash_algorithm == constants.HASH_ALGORITHM_XXH3 and not XXHASH_AVAILABLE:
+                error = (f"The database {database_path} uses xxh3_128 hashes - "
+                         f"install the xxhash package to process files with it")
+                logger.error(error)
+                return {
+                    "duplicate_files": [],
+                    "original_files": [],
+                    "original_bytes": 0,
+                    "filtered_files": [],
+                    "status": "failed",
+                    "error": error,
+                    "files_processed": 0,
+                    "files_skipped": 0,
+                    "filter_statistics": None
+                }
+
+            # Files can only be duplicates if their sizes match. Sizes already stored plus
+            # sizes seen in this run let new-size files skip every duplicate lookup.
+            known_sizes = db.get_all_file_sizes()
+
             # Create progress bar for file processing
-            with tqdm(total=len(files), desc="Processing files", unit="file",
+            with tqdm(total=total_files, desc="Processing files", unit="file",
+                     mininterval=constants.TQDM_MIN_INTERVAL,
                      bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]') as pbar:
-                for file_index, filename in enumerate(files, 1):
+                for file_index, (filename, is_photo) in enumerate(checked_files, 1):
+                    files_seen = file_index
                     try:
-                        # Update progress bar description with current file
-                        pbar.set_postfix_str(os.path.basename(filename)[:constants.MAX_FILENAME_DISPLAY_LENGTH])
+                        # Update progress bar description with current file - periodically, shown on the next redraw
+                        if file_index % constants.PROGRESS_POSTFIX_EVERY == 0:
+                            pbar.set_postfix_str(os.path.basename(filename)[:constants.MAX_FILENAME_DISPLAY_LENGTH], refresh=False)
 
                         # Progress callback for GUI
                         if progress_callback:
@@ -652,25 +940,30 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                                 'duplicates': len(duplicate_files),
                                 'filtered': len(filtered_files)
                             }
-                            progress_callback(file_index, len(files), filename, stats)
+                            progress_callback(file_index, total_files or file_index, filename, stats)
 
-                        if not os.path.isfile(filename):
+                        if is_photo is None:
                             logger.warning(f"Skipping non-file entry: {filename}")
                             pbar.update(1)
                             continue
 
-                        logger.info(f"Processing file {file_index}/{len(files)}: {filename}")
+                        logger.info(f"Processing file {file_index}/{total_display}: {filename}")
 
                         # PHOTO FILTERING: Check if file is a real photograph
                         if photo_filter and photo_filter.enabled:
-                            if not photo_filter.is_photo(filename):
-                                filter_reason = photo_filter.get_filter_reason(filename)
+                            if not is_photo:
+                                # The image properties were read by the filter check - not opened again
+                                filter_reason, width, height, has_exif = photo_filter.get_filter_details(filename)
                                 logger.info(f"FILTERED OUT (non-photo): {filename} - Reason: {filter_reason}")
 
-                                # Gather comprehensive file information for UI display
+                                # Gather comprehensive file information for UI display.  Format and
+                                # mode are read by the Filtered Files tab for the file being viewed.
                                 filtered_file = {
                                     "file_path": filename,
-                                    "filter_reason": filter_reason
+                                    "filter_reason": filter_reason,
+                                    "width": width,
+                                    "height": height,
+                                    "has_exif": has_exif
                                 }
 
                                 # Get file size
@@ -679,38 +972,10 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                                 except:
                                     filtered_file["file_size"] = 0
 
-                                # Get image properties
-                                try:
-                                    from PIL import Image
-                                    with Image.open(filename) as img:
-                                        filtered_file["width"] = img.size[0]
-                                        filtered_file["height"] = img.size[1]
-                                        filtered_file["format"] = img.format or "Unknown"
-                                        filtered_file["mode"] = img.mode
-
-                                        # Check for EXIF data
-                                        try:
-                                            exif_data = img._getexif()
-                                            filtered_file["has_exif"] = exif_data is not None and len(exif_data) > 0
-                                        except:
-                                            filtered_file["has_exif"] = False
-                                except Exception as e:
-                                    # If we can't open the image, set defaults
-                                    filtered_file["width"] = 0
-                                    filtered_file["height"] = 0
-                                    filtered_file["format"] = "Unknown"
-                                    filtered_file["mode"] = "Unknown"
-                                    filtered_file["has_exif"] = False
-
                                 # Individual filter check results (for detailed review)
-                                filtered_file["passes_size"] = photo_filter._check_file_size(filename)
-                                try:
-                                    with Image.open(filename) as img:
-                                        filtered_file["passes_dimensions"] = photo_filter._check_dimensions(img, filename)
-                                        filtered_file["passes_square_check"] = photo_filter._check_square_icon(img, filename)
-                                except:
-                                    filtered_file["passes_dimensions"] = False
-                                    filtered_file["passes_square_check"] = False
+                                filtered_file["passes_size"] = photo_filter._check_file_size(filtered_file["file_size"])
+                                filtered_file["passes_dimensions"] = photo_filter._check_dimensions(width, height, filename)
+                                filtered_file["passes_square_check"] = photo_filter._check_square_icon(width, height, filename)
 
                                 filtered_file["passes_filename"] = photo_filter._check_filename(filename)
 
@@ -732,10 +997,29 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                         use_partial_hash = (partial_hash_enabled and
                                            file_size >= partial_hash_min_file_size)
 
-                        if use_partial_hash:
+                        # SIZE-FIRST CHECK: no stored or earlier file has this size, so it is unique
+                        size_is_new = known_sizes is not None and file_size not in known_sizes
+                        if known_sizes is not None:
+                            known_sizes.add(file_size)
+
+                        if size_is_new:
+                            # Hashes are still needed for storage so later runs can match this file, but
+                            # no partial hash lookup is needed - both hashes come from one read of the file
+                            logger.info(f"Unique file size ({utils.format_file_size(file_size)}) - skipping duplicate lookups: {filename}")
+                            try:
+                                if use_partial_hash:
+                                    file_hash, partial_hash = hash_file_with_partial(filename, partial_hash_bytes, hash_algorithm)
+                                else:
+                                    file_hash = hash_file(filename, hash_algorithm)
+                            except Exception as e:
+                                logger.exception(f"Hash failed for {filename}: {e}")
+                                pbar.update(1)
+                                continue
+
+                        elif use_partial_hash:
                             # STAGE 1: Quick partial hash check
                             try:
-                                partial_hash = hash_file_partial(filename, partial_hash_bytes)
+                                partial_hash = hash_file_partial(filename, partial_hash_bytes, hash_algorithm)
                                 logger.info(f"Partial hash calculated for {filename} ({utils.format_file_size(file_size)})")
                             except Exception as e:
                                 logger.exception(f"Partial hash failed for {filename}: {e}")
@@ -749,7 +1033,7 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                                 # Potential duplicate - STAGE 2: Verify with full hash
                                 logger.info(f"Partial hash match found! Calculating full hash to confirm for {filename}")
                                 try:
-                                    file_hash = hash_file(filename)
+                                    file_hash = hash_file(filename, hash_algorithm)
                                 except Exception as e:
                                     logger.exception(f"Full hash failed for {filename}: {e}")
                                     pbar.update(1)
@@ -778,7 +1062,7 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                                 # Calculate full hash for storage
                                 logger.info(f"No partial hash match - file is unique: {filename}")
                                 try:
-                                    file_hash = hash_file(filename)
+                                    file_hash = hash_file(filename, hash_algorithm)
                                 except Exception as e:
                                     logger.exception(f"Full hash failed for {filename}: {e}")
                                     pbar.update(1)
@@ -788,7 +1072,7 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                             # Small file - skip partial hash, go straight to full hash
                             logger.debug(f"Small file ({utils.format_file_size(file_size)}) - using full hash only: {filename}")
                             try:
-                                file_hash = hash_file(filename)
+                                file_hash = hash_file(filename, hash_algorithm)
                             except Exception as e:
                                 logger.exception(f"Hash failed for {filename}: {e}")
                                 pbar.update(1)
@@ -808,8 +1092,8 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                                 pbar.update(1)
                                 continue
 
-                        # Check against in-memory hash list (current batch)
-                        if file_hash in hashes:
+                        # Check against in-memory hash set (current batch)
+                        if not size_is_new and file_hash in hashes:
                             logger.info(f"Duplicate in current batch: {filename}")
                             duplicate_file = {
                                 "file_hash": file_hash,
@@ -822,7 +1106,7 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                         else:
                             # NEW UNIQUE FILE - Save to database
                             logger.info(f"Unique file - saving to database: {filename}")
-                            hashes.append(file_hash)
+                            hashes.add(file_hash)
 
                             # Get the create date
                             file_year, file_month, file_day = get_creation_date(filename)
@@ -834,9 +1118,11 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                                 "file_create_datetime": file_create_date,
                                 "file_create_year": file_year,
                                 "file_create_month": file_month,
-                                "file_create_day": file_day
+                                "file_create_day": file_day,
+                                "file_size": file_size
                             }
                             original_files.append(original_file)
+                            original_bytes += file_size
 
                             # Add to database with partial hash info
                             db.insert_unique_photo(
@@ -857,7 +1143,7 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                             # Periodic commit to preserve progress
                             if batch_size > 0 and files_since_last_commit >= batch_size:
                                 db.commit()
-                                logger.info(f"*** CHECKPOINT: Committed {files_since_last_commit} files to database. Progress: {files_processed}/{len(files)} ***")
+                                logger.info(f"*** CHECKPOINT: Committed {files_since_last_commit} files to database. Progress: {files_processed}/{total_display} (seen {files_seen}) ***")
                                 files_since_last_commit = 0
 
                             # Update progress bar after successful processing
@@ -875,7 +1161,7 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
                 logger.info(f"*** FINAL COMMIT: Committed final {files_since_last_commit} files to database ***")
 
             logger.info(f"=== PROCESSING COMPLETE ===")
-            logger.info(f"Total files processed: {files_processed}/{len(files)}")
+            logger.info(f"Total files processed: {files_processed}/{files_seen}")
             logger.info(f"Unique files added: {len(original_files)}")
             logger.info(f"Duplicates found: {len(duplicate_files)}")
             logger.info(f"Files skipped (already in DB): {files_skipped}")
@@ -887,6 +1173,7 @@ def find_duplicates(files, hashes, database_path=constants.DEFAULT_DATABASE_NAME
         results = {}
         results["duplicate_files"] = duplicate_files
         results["original_files"] = original_files
+        results["original_bytes"] = original_bytes
         results["filtered_files"] = filtered_files
         results["status"] = "completed"
         results["files_processed"] = files_processed
@@ -5,14 +5,20 @@ This module provides a centralized configuration system that handles loading,
 validating, and accessing application settings with proper defaults.
 """
 
+import copy
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import constants
 
 
+# Parsed settings files keyed by absolute path -> ((mtime_ns, size), settings).
+# Re-reading an unchanged file (e.g. the GUI starting several runs) reuses the parsed dict.
+_LOADED_SETTINGS_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
 class Config:
     """
     Configuration manager for PhotoOrganizer.
@@ -109,8 +115,18 @@ class Config:
             )
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                loaded_settings = json.load(f)
+            cache_key = os.path.abspath(self.config_file)
+            stat = os.stat(cache_key)
+            file_version = (stat.st_mtime_ns, stat.st_size)
+            cached = _LOADED_SETTINGS_CACHE.get(cache_key)
+            if cached and cached[0] == file_version:
+                loaded_settings = cached[1]
+            else:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    loaded_settings = json.load(f)
+                _LOADED_SETTINGS_CACHE[cache_key] = (file_version, loaded_settings)
+            # Validation normalizes lists in place, so never hand out the cached objects
+            loaded_settings = copy.deepcopy(loaded_settings)
 
             # Start with defaults, then overlay loaded settings
             self._settings = self.DEFAULTS.copy()
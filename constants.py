@@ -12,6 +12,10 @@ to improve code readability and maintainability.
 # Chunk size for reading files during hashing (4KB - optimal disk read size)
 FILE_READ_CHUNK_SIZE = 4096
 
+# Bytes compared at the start and end of two same-size files before a full comparison (64KB)
+# Differing files almost always differ in the header (EXIF, thumbnails), so most checks stop here
+COMPARE_HEAD_TAIL_BYTES = 65536
+
 # Size units for human-readable formatting
 BYTES_PER_KB = 1024
 BYTES_PER_MB = 1024 * 1024
@@ -26,6 +30,16 @@ BYTES_PER_GB = 1024 * 1024 * 1024
 # This provides good balance between speed and collision avoidance
 PARTIAL_HASH_BYTES = 16384
 
+# Content hash algorithms used for duplicate detection
+# Each photo database records the algorithm it was built with; existing databases stay on SHA-256.
+# New databases use xxh3_128 when the optional xxhash package is installed (non-cryptographic, much faster).
+HASH_ALGORITHM_SHA256 = "sha256"
+HASH_ALGORITHM_XXH3 = "xxh3_128"
+
+# Minimum file size to hash through a memory map instead of buffered reads (16MB)
+# Large files are hashed straight from the kernel's page cache without copying into Python bytes
+MMAP_HASH_MIN_FILE_SIZE = 16 * 1024 * 1024
+
 # Minimum file size to use partial hashing (1MB)
 # Files smaller than this are hashed fully in one pass
 PARTIAL_HASH_MIN_FILE_SIZE = 1048576
@@ -42,6 +56,22 @@ DEFAULT_BATCH_SIZE = 100
 # Default database filename
 DEFAULT_DATABASE_NAME = 'PhotoDB.db'
 
+# Maximum number of bytes of the database file SQLite may memory-map (1GB)
+SQLITE_MMAP_SIZE = 1073741824
+
+
+# ============================================================================
+# ORGANIZE CONSTANTS
+# ============================================================================
+
+# Upper limit on worker threads copying/moving files into the archive
+# The pool uses min(ORGANIZE_MAX_WORKERS, cpu_count * 4) threads - the work is I/O bound
+ORGANIZE_MAX_WORKERS = 32
+
+# Buffer size for shutil file copies where no zero-copy path exists (Windows, cross-device moves) (4MB)
+# Linux sendfile and macOS fcopyfile do not use it
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
 
 # ============================================================================
 # PHOTO FILTERING CONSTANTS
@@ -63,6 +93,20 @@ MAX_PHOTO_HEIGHT = 50000
 # Square images smaller than this are likely icons/logos
 MIN_SQUARE_SIZE = 400
 
+# Maximum worker threads for PhotoFilter.filter_batch
+# The pool uses min(FILTER_MAX_WORKERS, cpu_count * 4) threads - the checks are I/O bound
+FILTER_MAX_WORKERS = 32
+
+# Files find_duplicates hands to PhotoFilter.filter_batch at a time
+# Large enough to keep the pool busy, small enough that progress starts quickly
+FILTER_BATCH_SIZE = 128
+
+# Number of image header results (size, EXIF presence) PhotoFilter keeps in memory
+FILTER_HEADER_CACHE_SIZE = 4096
+
+# Bytes read from the start of a JPEG/PNG file when looking for an EXIF block (8KB)
+EXIF_SCAN_BYTES = 8192
+
 
 # ============================================================================
 # UI/DISPLAY CONSTANTS
@@ -74,6 +118,46 @@ MAX_FILENAME_DISPLAY_LENGTH = 40
 # Alternate filename display length for directory scanning
 MAX_FILENAME_DISPLAY_LENGTH_SCAN = 50
 
+# Minimum seconds between progress callbacks while organizing files
+# The GUI cannot render more often than this, and each callback is a cross-thread Qt signal
+PROGRESS_CALLBACK_INTERVAL = 0.1
+
+# Minimum seconds between console progress bar redraws
+TQDM_MIN_INTERVAL = 0.2
+
+# Show the current file name on console progress bars every N files
+PROGRESS_POSTFIX_EVERY = 50
+
+# Databases sent to the selector dialog per update while the database scan runs
+DATABASE_SCAN_BATCH_SIZE = 8
+
+# Seconds the Database tab trusts a cached archive-folder existence check
+# (changes seen by the file system watcher invalidate it sooner)
+ARCHIVE_STATUS_CACHE_SECONDS = 5
+
+# Milliseconds the Database tab waits after a refresh request before refreshing,
+# so a burst of requests (e.g. repeated clicks) runs a single refresh
+DATABASE_REFRESH_DEBOUNCE_MS = 150
+
+# Milliseconds informational messages stay in the main window status bar
+STATUS_MESSAGE_TIMEOUT_MS = 5000
+
+# Milliseconds the Filtered Files tab waits after a selection change before loading
+# the preview, so scrolling through rows with the keyboard decodes only the last one
+PREVIEW_DEBOUNCE_MS = 200
+
+# Filtered Files tab previews kept in memory (thumbnails are also cached on disk)
+PREVIEW_PIXMAP_CACHE_SIZE = 64
+
+# JPEG quality of the preview thumbnails cached on disk
+PREVIEW_THUMBNAIL_QUALITY = 80
+
+# Rows the filtered files export writes between progress updates and cancel checks
+EXPORT_PROGRESS_INTERVAL = 1000
+
+# Minimum seconds between writes of a database's last_used_date while it stays open
+LAST_USED_UPDATE_INTERVAL = 60
+
 
 # ============================================================================
 # FILE VALIDATION CONSTANTS
@@ -96,7 +180,8 @@ VIDEO_EXTENSIONS = ['.mov', '.mp4', '.avi', '.mkv', '.wmv', '.flv', '.mpg', '.mp
 DEFAULT_EXCLUDED_PATTERNS = ['favicon', 'icon', 'logo', 'thumb', 'button', 'badge', 'sprite']
 
 # HEIC/HEIF file extensions (Apple photos)
-HEIC_EXTENSIONS = ('.heic', '.heif', '.HEIC', '.HEIF')
+# Lowercase set - compare against os.path.splitext(path)[1].lower()
+HEIC_EXTENSIONS = frozenset({'.heic', '.heif'})
 
 
 # ============================================================================
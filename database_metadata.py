@@ -9,9 +9,11 @@ import sqlite3
 import os
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, Iterator, List, Dict, Any, Tuple
 from pathlib import Path
 
+import constants
+
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,31 @@ class DatabaseMetadata:
         );
     """
 
+    METADATA_SELECT = """
+        SELECT database_name, description, archive_location, video_archive_location,
+               separate_video_archive, created_date, last_used_date, schema_version, total_photos,
+               substr(created_date, 1, 10), substr(last_used_date, 1, 10)
+        FROM DatabaseMetadata WHERE id = 1
+    """
+
+    @staticmethod
+    def _metadata_from_row(row) -> Dict[str, Any]:
+        """Build the metadata dictionary from a METADATA_SELECT row."""
+        return {
+            'database_name': row[0],
+            'description': row[1],
+            'archive_location': row[2],
+            'video_archive_location': row[3],
+            'separate_video_archive': bool(row[4]),
+            'created_date': row[5],
+            'last_used_date': row[6],
+            'schema_version': row[7],
+            'total_photos': row[8],
+            # Date parts only (YYYY-MM-DD) for display, trimmed by SQLite
+            'created_date_short': row[9],
+            'last_used_short': row[10]
+        }
+
     def __init__(self, database_path: str):
         """
         Initialize database metadata manager.
@@ -152,25 +179,11 @@ class DatabaseMetadata:
         try:
             with sqlite3.connect(self.database_path) as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT database_name, description, archive_location, video_archive_location,
-                           separate_video_archive, created_date, last_used_date, schema_version, total_photos
-                    FROM DatabaseMetadata WHERE id = 1
-                """)
+                cursor.execute(self.METADATA_SELECT)
 
                 row = cursor.fetchone()
                 if row:
-                    return {
-                        'database_name': row[0],
-                        'description': row[1],
-                        'archive_location': row[2],
-                        'video_archive_location': row[3],
-                        'separate_video_archive': bool(row[4]),
-                        'created_date': row[5],
-                        'last_used_date': row[6],
-                        'schema_version': row[7],
-                        'total_photos': row[8]
-                    }
+                    return self._metadata_from_row(row)
                 return None
 
         except sqlite3.OperationalError:
@@ -181,6 +194,72 @@ class DatabaseMetadata:
             logger.error(f"Failed to get metadata: {e}")
             return None
 
+    def get_metadata_bundle(self) -> Optional[Dict[str, Any]]:
+        """
+        Refresh total_photos, read the metadata and update last_used_date in one transaction.
+
+        Does the work of refresh_total_photos(), get_metadata() and update_last_used()
+        over a single connection. The returned last_used_date is the value from
+        before this call, as get_metadata() followed by update_last_used() would give.
+
+        Only changed values are written: total_photos when the count differs, and
+        last_used_date when it is older than constants.LAST_USED_UPDATE_INTERVAL.
+        Repeated refreshes therefore usually commit nothing.
+
+        Returns:
+            Dictionary with metadata or None if not found
+        """
+        try:
+            with sqlite3.connect(self.database_path) as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(self.METADATA_SELECT)
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                metadata = self._metadata_from_row(row)
+
+                try:
+                    cursor.execute("SELECT COUNT(*) FROM UniquePhotos")
+                    count = cursor.fetchone()[0]
+                    if count != metadata['total_photos']:
+                        cursor.execute(
+                            "UPDATE DatabaseMetadata SET total_photos = ? WHERE id = 1", (count,)
+                        )
+                        metadata['total_photos'] = count
+                except sqlite3.OperationalError as e:
+                    # No UniquePhotos table yet - keep the stored count
+                    logger.error(f"Failed to refresh total_photos: {e}")
+
+                now = datetime.now()
+                if self._last_used_is_stale(metadata['last_used_date'], now):
+                    cursor.execute(
+                        "UPDATE DatabaseMetadata SET last_used_date = ? WHERE id = 1",
+                        (now.isoformat(),)
+                    )
+
+                conn.commit()
+                return metadata
+
+        except sqlite3.OperationalError:
+            # Metadata table doesn't exist (old database)
+            logger.warning(f"No metadata table in {self.database_path}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get metadata: {e}")
+            return None
+
+    @staticmethod
+    def _last_used_is_stale(last_used_date: Optional[str], now: datetime) -> bool:
+        """Check whether a stored last_used_date is old enough to be rewritten."""
+        if not last_used_date:
+            return True
+        try:
+            age = now - datetime.fromisoformat(last_used_date)
+        except ValueError:
+            return True
+        return age.total_seconds() >= constants.LAST_USED_UPDATE_INTERVAL
+
     def get_archive_location(self) -> Optional[str]:
         """
         Get the archive location for this database.
@@ -211,7 +290,8 @@ class DatabaseMetadata:
         metadata = self.get_metadata()
         return metadata.get('separate_video_archive', False) if metadata else False
 
-    def set_video_archive(self, video_archive_location: str, enabled: bool = True) -> bool:
+    def set_video_archive(self, video_archive_location: str,
+                          enabled: bool = True) -> Optional[Tuple[Optional[str], bool]]:
         """
         Set or update the video archive location.
 
@@ -220,7 +300,8 @@ class DatabaseMetadata:
             enabled: Whether to enable separate video archive
 
         Returns:
-            True if successful, False otherwise
+            (video_archive_location, separate_video_archive) as now stored if successful,
+            None otherwise
         """
         try:
             # Validate path if enabling
@@ -239,11 +320,11 @@ class DatabaseMetadata:
                 conn.commit()
 
                 logger.info(f"Video archive {'enabled' if enabled else 'disabled'}: {video_archive_location if enabled else 'N/A'}")
-                return True
+                return (video_archive_location if enabled else None), enabled
 
         except Exception as e:
             logger.error(f"Failed to set video archive: {e}")
-            return False
+            return None
 
     def update_last_used(self):
         """Update the last used timestamp."""
@@ -347,30 +428,41 @@ class DatabaseMetadata:
         Returns:
             List of dictionaries with database info
         """
-        databases = []
+        return list(DatabaseMetadata.iter_databases(search_path))
+
+    @staticmethod
+    def iter_databases(search_path: str = ".") -> Iterator[Dict[str, Any]]:
+        """
+        Yield PyPhotoOrganizer databases in a directory as they are found.
 
+        Same results as find_databases, for callers that show progress during the scan.
+
+        Args:
+            search_path: Directory to search for databases
+
+        Yields:
+            Dictionary with database info
+        """
         try:
             search_dir = Path(search_path)
             for db_file in search_dir.glob("*.db"):
                 try:
                     db_meta = DatabaseMetadata(str(db_file))
                     metadata = db_meta.get_metadata()
-
-                    if metadata:
-                        databases.append({
-                            'path': str(db_file.absolute()),
-                            'filename': db_file.name,
-                            **metadata
-                        })
                 except Exception as e:
                     logger.debug(f"Skipping {db_file}: {e}")
                     continue
 
+                if metadata:
+                    yield {
+                        'path': str(db_file.absolute()),
+                        'filename': db_file.name,
+                        **metadata
+                    }
+
         except Exception as e:
             logger.error(f"Failed to search for databases: {e}")
 
-        return databases
-
     @staticmethod
     def create_database(database_path: str, database_name: str,
                        archive_location: str, description: str = "") -> bool:
@@ -55,17 +55,13 @@ detect duplicate file repository =
 
 import argparse
 import datetime
-import filecmp
 import json
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from PIL import Image
-from PIL.ExifTags import TAGS
-import pillow_heif  # https://github.com/bigcat88/pillow_heif
-# from pillow_heif import register_heif_opener
-
-from PIL.ExifTags import GPSTAGS
 import shutil
 import sys
 from tqdm import tqdm
@@ -73,11 +69,15 @@ from tqdm import tqdm
 import DuplicateFileDetection
 import utils
 from config import Config
+from database_metadata import DatabaseMetadata
 import constants
 
 # Configure logging using shared utility
 logger = utils.setup_logger(__name__, "main_app_error.log")
 
+# Larger copy buffer for shutil.copyfile/move read-write loops - fewer syscalls per MB on multi-GB videos
+shutil.COPY_BUFSIZE = max(shutil.COPY_BUFSIZE, constants.COPY_BUFFER_SIZE)
+
 
 def configure_logging(verbose):
     """
@@ -86,9 +86,12 @@ def configure_logging(verbose):
     Parameters:
     verbose (bool): If True, enable verbose logging.
     """
+    # The cached formatter only runs strftime once per second instead of once per record
+    handler = logging.StreamHandler()
+    handler.setFormatter(utils.CachedTimeFormatter("%(asctime)s - %(levelname)s - %(message)s"))
     logging.basicConfig(
         level=logging.DEBUG if verbose else logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
+        handlers=[handler],
     )
 
 
@@ -136,13 +139,241 @@ def parse_arguments():
     return parser.parse_args()
 
 
+def _reserve_target_path(target_path, reserved_targets):
+    """
+    Pick and reserve the archive path for a file, avoiding name collisions. Call with the target lock held.
+
+    Only names are checked here. When a file with the preferred name already exists, a free second
+    name is reserved and the existing file is returned, so the caller can compare it with the source
+    after releasing the lock.
+
+    Parameters:
+    target_path (str): Preferred destination path (destination folder + original file name)
+    reserved_targets (set): Paths other workers are currently writing to. The chosen path is added.
+
+    Returns:
+    tuple: (path reserved for writing, existing file with the preferred name or None)
+    """
+    existing_path = None
+    if target_path in reserved_targets:
+        # Another worker is writing a different original (duplicates were removed by hash) to this name
+        logger.info("File %s is being written by another worker. Choosing a new name.", target_path)
+    elif os.path.exists(target_path):
+        # There could be two files with same name but different images - the caller compares them
+        existing_path = target_path
+    else:
+        logger.info("The original file has an original name that is not in the Stored files.  So write the file and continue.")
+        reserved_targets.add(target_path)
+        return target_path, None
+
+    ####
+    # A file already exists in the Sorted file with the same name.  If it is not identical, store both of them so a human can figure out if they are different.
+    ####
+    name, ext = os.path.splitext(target_path)
+    counter = 1
+    candidate = target_path
+    while candidate in reserved_targets or os.path.exists(candidate):
+        candidate = f"{name}_{counter}{ext}"
+        counter += 1
+    reserved_targets.add(candidate)
+    return candidate, existing_path
+
+
+def _move_file(file_path, target_path):
+    """
+    Move a file, trying a plain rename before shutil.move.
+
+    Within one filesystem os.rename is a single metadata operation. Across drives it raises
+    OSError and shutil.move falls back to copy + delete.
+
+    Parameters:
+    file_path (str): Source file
+    target_path (str): Destination path (must not exist - chosen by _reserve_target_path)
+    """
+    try:
+        os.rename(file_path, target_path)
+    except OSError:
+        shutil.move(file_path, target_path)
+
+
+def _destination_folder_builder(group_by_year, group_by_day):
+    """
+    Choose the destination folder layout once for a run.
+
+    Parameters:
+    group_by_year (bool): Place month folders inside a year folder
+    group_by_day (bool): Add a day folder below the month folder
+
+    Returns:
+    callable: function(base_destination, year, month, day) returning the destination folder
+    """
+    join = os.path.join
+    if group_by_year and group_by_day:
+        # ex: c:\2024\11\25
+        return lambda base, year, month, day: join(base, year, month, day)
+    if group_by_year:
+        # ex: c:\2024\11
+        return lambda base, year, month, day: join(base, year, month)
+    if group_by_day:
+        # ex: c:\2024-11\25
+        return lambda base, year, month, day: join(base, f"{year}-{month}", day)
+    # ex: c:\2024-11
+    return lambda base, year, month, day: join(base, f"{year}-{month}")
+
+
+def _convert_heic(target_path):
+    """
+    Save a JPEG copy next to an archived HEIC/HEIF file.
+
+    Runs on the HEIC conversion pool so the decode and encode do not hold up the next transfer.
+
+    Parameters:
+    target_path (str): Path of the HEIC file in the archive
+
+    Returns:
+    str or None: Path of the JPEG file, or None if the conversion failed
+    """
+    jpeg_file_path = f"{os.path.splitext(target_path)[0]}.jpeg"
+    try:
+        try:
+            jpeg_exists = os.stat(jpeg_file_path).st_size > 0
+        except FileNotFoundError:
+            jpeg_exists = False
+        if jpeg_exists:
+            # Converted on a previous run - skip the decode and re-encode
+            logger.debug("JPEG already exists for %s, skipping HEIC conversion.", target_path)
+            return jpeg_file_path
+
+        # Optional: pyvips streams tiles from the HEIC decoder straight into the JPEG encoder,
+        # so the full-resolution raster is never copied into Python memory
+        try:
+            import pyvips  # https://github.com/libvips/pyvips
+        except (ImportError, OSError):
+            pyvips = None
+
+        if pyvips is not None:
+            try:
+                pyvips.Image.new_from_file(target_path, access="sequential").write_to_file(jpeg_file_path)
+                logger.info("The new jpeg_file_path = '%s'", jpeg_file_path)
+                return jpeg_file_path
+            except pyvips.Error as e:
+                # libvips may be built without HEIF support - fall back to pillow_heif
+                logger.warning("pyvips could not convert %s, using pillow_heif: %s", target_path, e)
+
+        # Imported on the first HEIC file - runs without HEIC files never load libheif
+        from PIL import Image
+        import pillow_heif  # https://github.com/bigcat88/pillow_heif
+
+        # Read the archived copy - the source is gone when files are moved
+        heif_file = pillow_heif.read_heif(target_path)
+        heic_image = Image.frombytes(
+            heif_file.mode,
+            heif_file.size,
+            heif_file.data,
+            "raw",
+        )
+        logger.info("The new jpeg_file_path = '%s'", jpeg_file_path)
+        heic_image.save(jpeg_file_path, format="JPEG")
+        return jpeg_file_path
+    except Exception as e:
+        logger.exception(f"Exception in HEIC conversion for {target_path} = {e}")
+        return None
+
+
+def _process_one(original_file, settings):
+    """
+    Copy or move one original file into the archive, converting HEIC files to JPEG.
+
+    Runs on a worker thread. Choosing the target name is serialized with settings["target_lock"];
+    comparing with an existing same-named file and the transfer run in parallel with other workers and HEIC conversion is queued on settings["heic_pool"].
+
+    Parameters:
+    original_file (dict): Record from find_duplicates' original_files
+    settings (dict): Per-run snapshot built by organize_files (destination, folder builder, video archive,
+                     transfer function, target lock, reserved target set, created folders and HEIC pool)
+
+    Returns:
+    dict: status ("organized", "skipped" or "failed"), file_path, target_path and bytes (source size)
+    """
+    file_path = original_file["file_path"]
+    result = {"status": "failed", "file_path": file_path, "target_path": None,
+              "bytes": original_file.get("file_size", 0)}
+    try:
+        logger.info("file_path = %s", file_path)
+
+        # find_duplicates already read the creation date while hashing, so reuse it instead of
+        # re-opening the file for EXIF.  The year, month and day are strings.
+        year = original_file.get("file_create_year")
+        month = original_file.get("file_create_month")
+        day = original_file.get("file_create_day")
+        if not (year and month and day):
+            year, month, day = DuplicateFileDetection.get_creation_date(file_path)
+
+        # Determine base destination directory (photo archive or video archive)
+        if settings["video_archive_location"] and utils.is_video_file(file_path):
+            # Route video to video archive
+            base_destination = settings["video_archive_location"]
+            logger.info("Routing video file to video archive: %s", base_destination)
+        else:
+            # Route to photo archive (default)
+            base_destination = settings["destination_directory"]
+            logger.debug("Routing file to photo archive: %s", base_destination)
+
+        destination_folder = settings["build_destination_folder"](base_destination, f"{year}", f"{month}", f"{day}")
+
+        logger.info("The destination directory was set to: %s", destination_folder)
+
+        # Checking for an existing file and claiming the name must be atomic across workers
+        reserved_targets = settings["reserved_targets"]
+        with settings["target_lock"]:
+            # now verify if the destination folder exists, and if not, create it.  Each folder is checked once per run.
+            if destination_folder not in settings["seen_folders"]:
+                utils.ensure_directory_exists(destination_folder)
+                settings["seen_folders"].add(destination_folder)
+            # join the destination folder with the base file path.
+            target_path, existing_path = _reserve_target_path(
+                os.path.join(destination_folder, os.path.basename(file_path)), reserved_targets
+            )
+
+        try:
+            # The full comparison of two large files runs outside the lock so other workers keep going
+            if existing_path is not None:
+                logger.info("About to compare '%s' with '%s'.", file_path, existing_path)
+                if utils.files_equal(file_path, existing_path):
+                    logger.warning("File %s already exists and is identical. Skipping file and continuing with next file.", existing_path)
+                    result["status"] = "skipped"
+                    return result
+                logger.info("File %s already exists and is different.", existing_path)
+                logger.info("We will write a second file with the name %s.", target_path)
+
+            result["target_path"] = target_path
+            settings["transfer_file"](file_path, target_path)
+        finally:
+            # Once written, the file on disk guards the name. A skipped file releases its unused name.
+            with settings["target_lock"]:
+                reserved_targets.discard(target_path)
+        logger.info("%s %s to %s", settings["transfer_verb"], file_path, target_path)
+        result["status"] = "organized"
+
+        # if file = heic convert to jpeg in the background
+        if os.path.splitext(file_path)[1].lower() in constants.HEIC_EXTENSIONS:
+            settings["heic_pool"].submit(_convert_heic, target_path)
+        else:
+            logger.info("The file is NOT a HEIC format.")
+
+    except Exception as e:
+        logger.exception(f"Failed to organize '{file_path}' into '{result['target_path']}': {e}")
+
+    return result
+
+
 def organize_files(config, files, database_path=constants.DEFAULT_DATABASE_NAME, batch_size=constants.DEFAULT_BATCH_SIZE, progress_callback=None):
     """
     Organize files by moving or copying them to the Destination directory.
 
     Parameters:
     config (Config): Configuration object containing all settings
-    files (list): List of file paths to organize.
+    files (iterable): File paths to organize. May be a generator from DuplicateFileDetection.iter_file_list.
     database_path (str): Path to the SQLite database file
     batch_size (int): Number of files to process before committing to database
     progress_callback (callable): Optional callback function(organized, total, current_file, bytes_copied, total_bytes) for progress updates
@@ -151,14 +382,33 @@ def organize_files(config, files, database_path=constants.DEFAULT_DATABASE_NAME,
     dict: Dictionary containing:
         total_files_processed - Integer containing the total number of files in all the provided directories.
         total_new_original_files - Integer containing the total number of NEW photos detected.
+        error - Reason duplicate detection failed, or None.
 
     """
+    # Result state starts empty so every return path - including the except below - can report it
+    total_files_processed = 0
+    total_new_original_files = 0
+    duplicate_files = []
+    original_files = []
+    filtered_files = []
+    filter_stats = None
+    error = None
+
+    def build_result():
+        return {
+            "total_files_processed": total_files_processed,
+            "total_new_original_files": total_new_original_files,
+            "total_duplicates": len(duplicate_files),
+            "total_filtered": len(filtered_files),
+            "filter_statistics": filter_stats or {},
+            "filtered_files": filtered_files,
+            "error": error
+        }
+
     try:
         logger.info(f"Initializing organize_files")
 
         # Get settings from config object (already validated with defaults)
-        total_files_processed = 0
-        total_new_original_files = 0
         current_file_being_processed = 0
 
         # Extract settings from config
@@ -169,6 +419,17 @@ def organize_files(config, files, database_path=constants.DEFAULT_DATABASE_NAME,
         copy_files = config.copy_files
         move_files = config.move_files
 
+        # Resolve the copy/move operation once instead of re-checking the flags for every file.
+        # Bail out before duplicate detection so no files are recorded that will never be organized.
+        if copy_files and not move_files:
+            # use the copyfile not copy or copy2 in order to maintain the existing hash code of the original file!
+            transfer_file, transfer_verb = shutil.copyfile, "Copied"
+        elif move_files and not copy_files:
+            transfer_file, transfer_verb = _move_file, "Moved"
+        else:
+            logger.error("ERROR - Move and Copy files are not supported simultaneously")
+            return build_result()
+
         try:
             hashes = DuplicateFileDetection.load_photo_hashes(database_path)
             logger.info("The load_photo_hashes completed and returned 'hashes' ")
@@ -188,7 +449,8 @@ def organize_files(config, files, database_path=constants.DEFAULT_DATABASE_NAME,
             if results.get("status") == "completed":
                 logger.info("The DuplicateFileDetection routine completed.")
             else:
-                logger.info(f"The DuplicateFileDetection routine failed with a status returned = {results.get('status')}.")
+                error = results.get("error")
+                logger.error(f"The DuplicateFileDetection routine failed with a status returned = {results.get('status')}: {error}")
 
             duplicate_files = results['duplicate_files']
             # The files that are NOT duplicates, will be returned in original_files.  These need to be processed to be copied/moved
@@ -204,6 +466,7 @@ def organize_files(config, files, database_path=constants.DEFAULT_DATABASE_NAME,
                 logger.info(f"  - By dimensions: {filter_stats['filtered_by_dimensions']}")
                 logger.info(f"  - By square icon: {filter_stats['filtered_by_square']}")
                 logger.info(f"  - By filename pattern: {filter_stats['filtered_by_filename']}")
+                logger.info(f"  - By file extension: {filter_stats.get('filtered_by_extension', 0)}")
                 logger.info("=" * 70)
 
             logger.info("Completed locating files to be moved/copied.")
@@ -221,145 +484,74 @@ def organize_files(config, files, database_path=constants.DEFAULT_DATABASE_NAME,
             logger.info(f"  - Filtered (non-photos): {len(filtered_files)}")
             logger.info(f"original_files contains {total_new_original_files} NEW photos to be processed.")
 
-            # Calculate total bytes for progress tracking (used by GUI)
-            total_bytes = 0
-            if progress_callback:
-                try:
-                    for f in original_files:
-                        fp = f["file_path"]
-                        if os.path.exists(fp):
-                            total_bytes += os.path.getsize(fp)
-                except:
-                    total_bytes = 0  # If calculation fails, just use 0
+            # Calculate total bytes for progress tracking (used by GUI) from the sizes find_duplicates recorded
+            total_bytes = results.get("original_bytes")
+            if total_bytes is None:
+                total_bytes = sum(f.get("file_size", 0) for f in original_files)
+
+            # Snapshot of everything the workers need, resolved once for the whole run
+            db_meta = DatabaseMetadata(database_path)
+            video_archive_location = None
+            if db_meta.is_separate_video_archive_enabled():
+                video_archive_location = db_meta.get_video_archive_location()
+            settings = {
+                "destination_directory": destination_directory,
+                "build_destination_folder": _destination_folder_builder(group_by_year, group_by_day),
+                "video_archive_location": video_archive_location,
+                "transfer_file": transfer_file,
+                "transfer_verb": transfer_verb,
+                "target_lock": threading.Lock(),
+                "reserved_targets": set(),
+                "seen_folders": set(),
+            }
+
+            # Copying/moving is I/O bound, so files are transferred on a thread pool to overlap reads and writes
+            max_workers = min(constants.ORGANIZE_MAX_WORKERS, (os.cpu_count() or 4) * 4)
+            # HEIC decode/encode is CPU bound, so it gets its own smaller pool next to the transfer pool
+            heic_workers = max(2, (os.cpu_count() or 4) // 2)
+            logger.info(f"Organizing {len(original_files)} files with {max_workers} worker threads")
 
             # Progress bar for copying/moving files
             bytes_copied = 0
+            if progress_callback:
+                # Totals are already known, so the GUI can show the organize stage before the first file completes
+                progress_callback(0, len(original_files), "", bytes_copied, total_bytes)
             with tqdm(total=len(original_files), desc="Organizing files", unit="file",
+                     mininterval=constants.TQDM_MIN_INTERVAL, miniters=max(1, len(original_files) // 1000),
                      bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]') as pbar:
-                for original_file in original_files:
-                    current_file_being_processed = current_file_being_processed + 1
-                    file_path = original_file["file_path"]
-                    pbar.set_postfix_str(os.path.basename(file_path)[:constants.MAX_FILENAME_DISPLAY_LENGTH])
-
-                    # Progress callback for GUI
-                    if progress_callback:
-                        progress_callback(current_file_being_processed, len(original_files),
-                                        file_path, bytes_copied, total_bytes)
-
-                    # Track bytes for next iteration
-                    if progress_callback and os.path.exists(file_path):
-                        try:
-                            bytes_copied += os.path.getsize(file_path)
-                        except:
-                            pass
-
-                    logger.info(f"file_path = {file_path}")
-                    year, month, day = DuplicateFileDetection.get_creation_date(file_path)
-                    # The year, month and day will be returned as strings.
-
-                    # Determine base destination directory (photo archive or video archive)
-                    # Check if file is a video and if separate video archive is enabled
-                    from database_metadata import DatabaseMetadata
-                    db_meta = DatabaseMetadata(database_path)
-                    is_video = utils.is_video_file(file_path)
-                    video_archive_enabled = db_meta.is_separate_video_archive_enabled()
-                    video_archive_location = db_meta.get_video_archive_location()
-
-                    if is_video and video_archive_enabled and video_archive_location:
-                        # Route video to video archive
-                        base_destination = video_archive_location
-                        logger.info(f"Routing video file to video archive: {base_destination}")
-                    else:
-                        # Route to photo archive (default)
-                        base_destination = destination_directory
-                        logger.debug(f"Routing file to photo archive: {base_destination}")
-
-                    if group_by_year:
-                        if group_by_day:
-                            # ex: c:\2024\11\25
-                            destination_folder = os.path.join(
-                                base_destination, f"{year}", f"{month}", f"{day}"
-                            )
-                        else:
-                            # ex: c:\2024\11
-                            destination_folder = os.path.join(
-                                base_destination, f"{year}", f"{month}"
-                            )
-                    else:
-                        if group_by_day:
-                            # ex: c:\2024-11\25
-                            destination_folder = os.path.join(
-                                base_destination, f"{year}-{month}", f"{day}"
-                            )
-                        else:
-                            # ex: c:\2024-11
-                            destination_folder = os.path.join(base_destination, f"{year}-{month}")
-
-                    logger.info(f"The destination directory was set to: {destination_folder}")
-
-                    # now verify if the destination folder exists, and if not, create it.
-                    utils.ensure_directory_exists(destination_folder)
-                    # join the destination folder with the base file path.
-                    target_path = os.path.join(destination_folder, os.path.basename(file_path))
-
-                    # now determine if the new file already exists in directory, and if so, verify if it is identical.  There could be two files with same name but different images.
-                    if os.path.exists(target_path):
-                        # do a full file comparison of the two files
-                        logger.info(f"About to compare '{file_path}' with '{target_path}'.")
-                        if filecmp.cmp(file_path, target_path, shallow=False):
-                            logger.warning(f"File {target_path} already exists and is identical. Skipping file and continuing with next file.")
-                            pbar.update(1)
-                            continue
-                        else:
-                            ####
-                            # A file already exists in the Sorted file with the same name, but is not identical.  So store both of them so a human can figure out if they are different.
-                            ####
-                            new_target_path = utils.get_unique_filename(target_path)
-                            logger.info(f"File {target_path} already exists and is different. We will write a second file with the name {new_target_path}.")
-                            target_path = new_target_path
-                    else:
-                        logger.info("The original file has an original name that is not in the Stored files.  So write the file and continue.")
-
-                    try:
-                        if copy_files and not move_files:
-                            # use the copyfile not copy or copy2 in order to maintain the existing hash code of the original file!
-                            shutil.copyfile(file_path, target_path)
-                            logger.info(f"Copied {file_path} to {target_path}")
-                        elif move_files and not copy_files:
-                            shutil.move(file_path, target_path)
-                            logger.info(f"Moved {file_path} to {target_path}")
-                        else:
-                            logger.info("ERROR - Move and Copy files are not supported simultaneously")
-
-                        # if file = heic convert to jpeg
-                        try:
-                            if file_path.endswith(constants.HEIC_EXTENSIONS):
-                                try:
-                                    heif_file = pillow_heif.read_heif(file_path)
-                                    heic_image = Image.frombytes(
-                                        heif_file.mode,
-                                        heif_file.size,
-                                        heif_file.data,
-                                        "raw",
-                                    )
-                                except Exception as e:
-                                    logger.error(f"The open file for {file_path} failed with error = {e}")
-
-                                jpeg_file_path = f"{target_path[:-5]}.jpeg"
-                                logger.info(f"The new jpeg_file_path = '{jpeg_file_path}'")
-                                heic_image.save(jpeg_file_path, format="JPEG")
-                            else:
-                                logger.info("The file is NOT a HEIC format.")
-                        except Exception as e:
-                            logger.exception(f"Exception in HEIC conversion = {e}")
-
-                        # image.save("./picture_name.png", format("png"))
-
-                    except Exception as e:
-                        logger.exception(f"Failed to {'copy' if copy_files else 'move'} '{file_path}' to '{target_path}': {e}")
-                    finally:
+                # Pools exit in reverse order: transfers finish first, then queued HEIC conversions are drained
+                with ThreadPoolExecutor(max_workers=heic_workers) as heic_pool, \
+                        ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    settings["heic_pool"] = heic_pool
+                    futures = [executor.submit(_process_one, original_file, settings) for original_file in original_files]
+
+                    # Bind per-completion lookups once; this loop runs for every organized file
+                    basename = os.path.basename
+                    set_postfix = pbar.set_postfix_str
+                    update_bar = pbar.update
+                    total_originals = len(original_files)
+                    display_length = constants.MAX_FILENAME_DISPLAY_LENGTH
+                    last_callback_time = 0.0
+
+                    for future in as_completed(futures):
+                        result = future.result()
+                        current_file_being_processed = current_file_being_processed + 1
+                        bytes_copied += result["bytes"]
+                        if current_file_being_processed % constants.PROGRESS_POSTFIX_EVERY == 0:
+                            # Shown on the next throttled redraw instead of forcing one
+                            set_postfix(basename(result["file_path"])[:display_length], refresh=False)
+
+                        # Progress callback for GUI - throttled, but the final file is always reported
+                        if progress_callback:
+                            now = time.monotonic()
+                            if (now - last_callback_time >= constants.PROGRESS_CALLBACK_INTERVAL
+                                    or current_file_being_processed == total_originals):
+                                progress_callback(current_file_being_processed, total_originals,
+                                                result["file_path"], bytes_copied, total_bytes)
+                                last_callback_time = now
+
                         # Update progress bar after each file (success or failure)
-                        pbar.update(1)
+                        update_bar(1)
             logger.info(f"Processed {total_files_processed} original files, and located {total_new_original_files} that are not duplicates.")
         else:
             total_files_processed = len(duplicate_files) + len(filtered_files)
@@ -371,57 +563,36 @@ def organize_files(config, files, database_path=constants.DEFAULT_DATABASE_NAME,
                 logger.info(f"  - {len(filtered_files)} files were filtered out as non-photos")
             logger.info("****************************************************************")
 
-        organize_files_return = {
-            "total_files_processed": total_files_processed,
-            "total_new_original_files": total_new_original_files,
-            "total_duplicates": len(duplicate_files),
-            "total_filtered": len(filtered_files),
-            "filter_statistics": filter_stats or {},
-            "filtered_files": filtered_files
-        }
-        return organize_files_return
+        return build_result()
 
     except Exception as e_organize_files:
         logger.exception(f"\n organize_files Failed : {sys.exc_info()} - {e_organize_files}")
-        organize_files_return = {
-            "total_files_processed": total_files_processed,
-            "total_new_original_files": total_new_original_files,
-            "total_duplicates": len(duplicate_files),
-            "total_filtered": len(filtered_files),
-            "filter_statistics": filter_stats or {},
-            "filtered_files": filtered_files
-        }
-        return organize_files_return
+        return build_result()
+
+
+# Settings written by write_settings; missing keys fall back to Config.DEFAULTS
+WRITTEN_SETTINGS = ("source_directory", "destination_directory", "include_subdirectories", "file_endings")
 
 
 def write_settings(existing_settings):
     try:
-        settings = {}
-        if "source_directory" in existing_settings:
-            settings["source_directory"] = existing_settings["source_directory"]
-        else:
-            settings["source_directory"] = 'W:\\All Photographs\\2003 - Photos'
-            settings["source_directory"] = "W:\\Mylio_Vault\\Mylio_83eacc_131074\\Apple Photos"
-
-        if "destination_directory" in existing_settings:
-            settings["destination_directory"] = existing_settings["destination_directory"]
-        else:
-            settings["destination_directory"] = "W:\\SortedPhotos"
+        settings = {key: existing_settings.get(key, Config.DEFAULTS[key]) for key in WRITTEN_SETTINGS}
+        missing = [key for key in Config.REQUIRED if not settings.get(key)]
+        if missing:
+            logger.warning(f"write_settings is missing required settings: {', '.join(missing)}")
 
-        if "include_subdirectories" in existing_settings:
-            settings["include_subdirectories"] = existing_settings["include_subdirectories"]
-        else:
-            settings["include_subdirectories"] = True
+        # Now write all the settings to the exe directory
+        try:
+            import orjson  # Optional: https://github.com/ijl/orjson
+        except ImportError:
+            orjson = None
 
-        if "file_endings" in existing_settings:
-            logger.info(f"The file_endings setting = {settings['file_endings']}")
+        if orjson is not None:
+            with open("settings.json", mode="wb") as write_file:
+                write_file.write(orjson.dumps(settings))
         else:
-            logger.info(f"file_endings not in settings so creating default!")
-            settings['file_endings'] = [".jpg", ".png", ".heic", ".mov", ".mp4"]
-
-        # Now write all the settings to the exe directory
-        with open("settings.json", mode="w", encoding="utf-8") as write_file:
-            json.dump(settings, write_file)
+            with open("settings.json", mode="w", encoding="utf-8") as write_file:
+                json.dump(settings, write_file, separators=(",", ":"))
 
     except Exception as e:
         logger.exception("The write_settings function failed - {e}")
@@ -445,16 +616,13 @@ def main():
     # Ensure the Destination directory exists
     utils.ensure_directory_exists(config.destination_directory)
 
-    # List all files in the source directory
-    files = DuplicateFileDetection.get_file_list(
+    # Stream the files in the source directories, so hashing starts while the scan is still running.
+    # The running count is logged by find_duplicates as files are consumed.
+    files = DuplicateFileDetection.iter_file_list(
         config.source_directory,
         config.include_subdirectories,
         config.file_endings
     )
-    logger.info("#############################################################################")
-    logger.info(f"The get_file_list function returned {len(files)} files for processing.")
-    logger.info("#############################################################################")
-    logger.info(f"The get_file_list function returned =  {files}")
 
     # Organize files by moving or copying them to the destination directory
     organize_files_return = organize_files(
@@ -5,16 +5,186 @@ This module provides functionality to filter out icons, web graphics, thumbnails
 and other small images that are not actual photographs.
 """
 
+import functools
 import logging
 import os
-from typing import Tuple, Optional
+import re
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import List, Tuple, Optional
 from PIL import Image
+from PIL import TiffImagePlugin, WebPImagePlugin  # noqa: F401 - registers the formats
+
+try:
+    import imagesize  # Optional: https://github.com/shibukawa/imagesize_py
+    IMAGESIZE_AVAILABLE = True
+except ImportError:
+    imagesize = None
+    IMAGESIZE_AVAILABLE = False
 
 import utils
 import constants
 
 # Configure logging using shared utility
 logger = utils.setup_logger(__name__, "photo_filter.log")
+# Per-file messages below use %-style arguments so they are only formatted when emitted
+
+# Register the common plugins now. With TIFF and WebP imported explicitly, Image.open
+# recognizes every format in constants.PHOTO_EXTENSIONS without falling back to
+# Image.init(), which imports all ~40 Pillow plugins on the first unrecognized file.
+Image.preinit()
+
+
+class FilterReason(IntEnum):
+    """Outcome of a filter check - the index of its counter in PhotoFilter statistics."""
+    PASSED = 0
+    FILENAME = 1
+    EXTENSION = 2
+    SIZE = 3
+    DIMENSIONS = 4
+    SQUARE = 5
+    EXIF = 6
+    READ_ERROR = 7
+
+
+# Reason strings returned by get_filter_reason -> counter index.
+# Anything not listed (image_read_error) counts as a read error.
+_REASON_INDEX = {
+    None: FilterReason.PASSED,
+    "filename_pattern": FilterReason.FILENAME,
+    "unsupported_extension": FilterReason.EXTENSION,
+    "file_size_too_small": FilterReason.SIZE,
+    "dimensions_out_of_range": FilterReason.DIMENSIONS,
+    "small_square_icon": FilterReason.SQUARE,
+    "missing_exif_data": FilterReason.EXIF,
+}
+
+# Reasons decided before the image header is read - _inspect reports no dimensions for them
+_HEADER_NOT_READ = frozenset({"filename_pattern", "unsupported_extension", "file_size_too_small"})
+
+
+@functools.lru_cache(maxsize=constants.FILTER_HEADER_CACHE_SIZE)
+def _read_header(file_path: str, mtime_ns: int, size: int,
+                 read_exif: bool) -> Tuple[int, int, Optional[bool]]:
+    """
+    Read an image's dimensions and, optionally, whether it has EXIF data.
+
+    Results are cached by path, modification time and size, so checking an unchanged
+    file again does not re-open it. Only the small result tuple is cached, never
+    the Image object. When the optional imagesize package is installed, the
+    dimensions come from its header parser and PIL is only used for formats it
+    does not understand (or for EXIF the head scan could not decide).
+
+    Parameters:
+        file_path (str): Path to the image
+        mtime_ns (int): st_mtime_ns of the file (cache key only)
+        size (int): st_size of the file (cache key only)
+        read_exif (bool): Whether to check for EXIF data
+
+    Returns:
+        tuple: (width, height, has_exif) - has_exif is None unless read_exif is set
+
+    Raises:
+        Exception: If the image cannot be opened (errors are not cached)
+    """
+    has_exif = _scan_exif_marker(file_path) if read_exif else None
+
+    if IMAGESIZE_AVAILABLE and (has_exif is not None or not read_exif):
+        try:
+            width, height = imagesize.get(file_path)
+        except Exception:
+            width, height = -1, -1  # Unparseable header - let PIL decide
+        if width > 0 and height > 0:
+            return width, height, has_exif
+
+    with Image.open(file_path) as img:
+        width, height = img.size
+        if read_exif and has_exif is None:
+            has_exif = _image_has_exif(img, file_path)
+    return width, height, has_exif
+
+
+def _scan_exif_marker(file_path: str) -> Optional[bool]:
+    """
+    Check for an EXIF block by scanning the start of the file, without parsing it.
+
+    For JPEG the segment markers in the first constants.EXIF_SCAN_BYTES are walked
+    (see _jpeg_has_exif); EXIF is only decided if its APP1 segment or the image data
+    is reached within them. PNG's eXIf chunk is usually near the start but may
+    follow large chunks, so only a hit is final.
+
+    Parameters:
+        file_path (str): Path to the image
+
+    Returns:
+        bool or None: True/False if the scan decided it, None if PIL has to check
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(constants.EXIF_SCAN_BYTES)
+    except OSError:
+        return None
+
+    if head.startswith(b'\xff\xd8'):  # JPEG
+        return _jpeg_has_exif(head)
+    if head.startswith(b'\x89PNG') and b'eXIf' in head:
+        return True
+    return None
+
+
+def _jpeg_has_exif(head: bytes) -> Optional[bool]:
+    """
+    Walk the JPEG segments in the first bytes of a file looking for the EXIF APP1 segment.
+
+    Large APP0 (JFIF thumbnail) or APP2 (ICC profile) segments may come before APP1,
+    and "Exif" bytes can also appear inside XMP or comments, so only an APP1 segment
+    whose data starts with "Exif" and two zero bytes counts.
+
+    Parameters:
+        head (bytes): Start of the file, beginning with the SOI marker
+
+    Returns:
+        bool or None: True at the EXIF segment, False at the image data (SOS) or end
+                      of image, None if head ends first or the markers are malformed
+    """
+    pos = 2  # Skip SOI
+    end = len(head)
+    while pos + 4 <= end:
+        if head[pos] != 0xFF:
+            return None  # Not a marker - let PIL decide
+        marker = head[pos + 1]
+        if marker == 0xFF:
+            pos += 1  # Fill byte before a marker
+            continue
+        if marker in (0xDA, 0xD9):
+            return False  # Image data (SOS) or end of image reached - metadata comes before it
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            pos += 2  # Standalone marker without a length
+            continue
+        if marker == 0xE1 and head[pos + 4:pos + 10] == b'Exif\x00\x00':
+            return True
+        if marker == 0xE1 and pos + 10 > end:
+            return None  # APP1 identifier cut off by the scan window
+        pos += 2 + int.from_bytes(head[pos + 2:pos + 4], 'big')
+    return None
+
+
+def _image_has_exif(img: Image.Image, file_path: str) -> bool:
+    """Check if image has EXIF data (camera metadata)."""
+    try:
+        # getexif() is public, works for every format and caches on the image;
+        # _getexif() is JPEG/WebP only and re-parses the whole EXIF block
+        exif_data = img.getexif()
+        if not exif_data:
+            logger.debug("No EXIF data found: %s", file_path)
+            return False
+        return True
+    except Exception:
+        # Some images don't support EXIF
+        logger.debug("Could not read EXIF data: %s", file_path)
+        return False
 
 
 class PhotoFilter:
@@ -56,14 +226,27 @@ class PhotoFilter:
         self.move_filtered_files = config.get('move_filtered_files', False)
         self.filtered_files_folder = config.get('filtered_files_folder', 'filtered_non_photos')
 
-        # Statistics
-        self.total_checked = 0
-        self.filtered_by_size = 0
-        self.filtered_by_dimensions = 0
-        self.filtered_by_square = 0
-        self.filtered_by_exif = 0
-        self.filtered_by_filename = 0
-        self.filtered_by_read_error = 0
+        # All excluded patterns as one compiled alternation - one regex scan per filename
+        # instead of one substring search per pattern
+        self._excluded_re = (
+            re.compile('|'.join(re.escape(pattern.lower()) for pattern in self.excluded_patterns))
+            if self.excluded_patterns else None
+        )
+        self._allowed_extensions = frozenset(ext.lower() for ext in constants.PHOTO_EXTENSIONS)
+
+        # Statistics - one counter per FilterReason, updated with a single indexed write
+        self._counts = array('Q', [0] * len(FilterReason))
+
+        # Guards the counters above when filter_batch is used from several threads
+        self._stats_lock = threading.Lock()
+
+        # Thread pool for filter_batch - created on first use and reused until close(),
+        # so checking many batches does not start and stop a pool for each one
+        self._executor = None
+
+        # {file_path: _inspect result} from the last is_photo/filter_batch call, so
+        # get_filter_reason/get_filter_details right after it do not open the image again
+        self._last_results = {}
 
     def is_photo(self, file_path: str) -> bool:
         """
@@ -78,103 +261,182 @@ class PhotoFilter:
         if not self.enabled:
             return True  # Filter disabled, accept all files
 
-        self.total_checked += 1
+        details = self._inspect(file_path)
+        self._last_results = {file_path: details}
+        return self._record(file_path, details[0])
 
-        # Check 1: Filename patterns
-        if not self._check_filename(file_path):
-            self.filtered_by_filename += 1
-            logger.debug(f"Filtered by filename pattern: {file_path}")
-            return False
+    def filter_batch(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[bool]:
+        """
+        Determine which of several files are real photographs, checking them in parallel.
 
-        # Check 2: File size
-        if not self._check_file_size(file_path):
-            self.filtered_by_size += 1
-            logger.debug(f"Filtered by file size: {file_path}")
-            return False
+        The checks are I/O bound (stat and image header reads), so a thread pool
+        overlaps them. Results and statistics are the same as calling is_photo
+        on each file in order. The pool is kept for later calls; call close()
+        when done checking files.
 
-        # Check 3: Image dimensions and properties (requires opening the file)
-        try:
-            with Image.open(file_path) as img:
-                # Check dimensions
-                if not self._check_dimensions(img, file_path):
-                    self.filtered_by_dimensions += 1
-                    return False
-
-                # Check for small squares (likely icons)
-                if not self._check_square_icon(img, file_path):
-                    self.filtered_by_square += 1
-                    return False
-
-                # Check EXIF data (if required)
-                if self.require_exif and not self._check_exif(img, file_path):
-                    self.filtered_by_exif += 1
-                    return False
+        Parameters:
+            file_paths (list): Paths of the files to check
+            max_workers (int): Thread pool size when the pool is created by this call
+                               (default: min(FILTER_MAX_WORKERS, cpu_count * 4))
+
+        Returns:
+            list: One bool per path, True if the file appears to be a photo
+        """
+        file_paths = list(file_paths)
+        if not self.enabled:
+            return [True] * len(file_paths)
 
+        if self._executor is None:
+            if max_workers is None:
+                max_workers = min(constants.FILTER_MAX_WORKERS, (os.cpu_count() or 4) * 4)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="photo_filter")
+
+        results = list(self._executor.map(self._inspect, file_paths))
+
+        self._last_results = dict(zip(file_paths, results))
+        return [self._record(path, details[0]) for path, details in zip(file_paths, results)]
+
+    def close(self):
+        """Shut down the filter_batch thread pool. A later filter_batch call starts a new one."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _record(self, file_path: str, reason: Optional[str]) -> bool:
+        """
+        Count a check result in the statistics.
+
+        Parameters:
+            file_path (str): Path of the checked file
+            reason (str or None): Filter reason from _inspect, or None if the file passed
+
+        Returns:
+            bool: True if the file passed (reason is None)
+        """
+        # If we can't read it, filter it out
+        index = _REASON_INDEX.get(reason, FilterReason.READ_ERROR)
+        with self._stats_lock:
+            self._counts[index] += 1
+
+        if index == FilterReason.PASSED:
+            # Passed all checks - it's a photo
+            return True
+
+        logger.debug("Filtered (%s): %s", reason, file_path)
+        return False
+
+    def _inspect(self, file_path: str) -> Tuple[Optional[str], int, int, Optional[bool]]:
+        """
+        Run every filter check, opening the image at most once (not at all if its
+        header result is already cached).
+
+        Parameters:
+            file_path (str): Path to the file to check
+
+        Returns:
+            tuple: (reason, width, height, has_exif)
+                - reason: filter reason (see get_filter_reason), or None if the file is a photo
+                - width, height: image size, or 0 if the image was not opened
+                - has_exif: EXIF presence if require_exif is set and it was checked, else None
+        """
+        # Checks 1-2: Filename, extension and size - no image decoding needed
+        reason, st = self._cheap_reject(file_path)
+        if reason is not None:
+            return reason, 0, 0, None
+
+        # Check 3: Image dimensions and properties (requires the image header)
+        try:
+            width, height, has_exif = _read_header(
+                file_path, st.st_mtime_ns, st.st_size, self.require_exif
+            )
         except Exception as e:
-            logger.warning(f"Could not read image {file_path}: {e}")
-            self.filtered_by_read_error += 1
-            return False  # If we can't read it, filter it out
+            logger.warning("Could not read image %s: %s", file_path, e)
+            return "image_read_error", 0, 0, None
 
-        # Passed all checks - it's a photo
-        return True
+        # Check dimensions
+        if not self._check_dimensions(width, height, file_path):
+            return "dimensions_out_of_range", width, height, None
 
-    def _check_filename(self, file_path: str) -> bool:
-        """Check if filename contains excluded patterns."""
-        filename = os.path.basename(file_path).lower()
+        # Check for small squares (likely icons)
+        if not self._check_square_icon(width, height, file_path):
+            return "small_square_icon", width, height, None
 
-        for pattern in self.excluded_patterns:
-            if pattern.lower() in filename:
-                return False
+        # Check EXIF data (if required)
+        if self.require_exif and not has_exif:
+            return "missing_exif_data", width, height, has_exif
 
-        return True
+        return None, width, height, has_exif
+
+    def _cheap_reject(self, file_path: str) -> Tuple[Optional[str], Optional[os.stat_result]]:
+        """
+        Run the checks that do not need PIL, cheapest first.
+
+        Parameters:
+            file_path (str): Path to the file to check
+
+        Returns:
+            tuple: (reason, stat)
+                - reason: filter reason, or None if the file still needs the image checks
+                - stat: os.stat result if the file was stat'ed, else None
+        """
+        if not self._check_filename(file_path):
+            return "filename_pattern", None
+
+        if not self._check_extension(file_path):
+            return "unsupported_extension", None
 
-    def _check_file_size(self, file_path: str) -> bool:
-        """Check if file size meets minimum requirement."""
+        # One stat per file; its result feeds the size check and the header cache key
         try:
-            file_size = os.path.getsize(file_path)
-            return file_size >= self.min_file_size
+            st = os.stat(file_path)
         except OSError as e:
-            logger.warning(f"Could not get file size for {file_path}: {e}")
-            return False
+            logger.warning("Could not get file size for %s: %s", file_path, e)
+            return "file_size_too_small", None
 
-    def _check_dimensions(self, img: Image.Image, file_path: str) -> bool:
-        """Check if image dimensions are within acceptable range."""
-        width, height = img.size
+        if not self._check_file_size(st.st_size):
+            return "file_size_too_small", st
+
+        return None, st
 
+    def _check_filename(self, file_path: str) -> bool:
+        """Check if filename contains excluded patterns."""
+        if self._excluded_re is None:
+            return True
+        # rpartition is a single C call; os.path.basename goes through the generic path helpers.
+        # Windows also accepts '/' (os.altsep) in paths, so split on that too.
+        filename = file_path.rpartition(os.sep)[2]
+        if os.altsep:
+            filename = filename.rpartition(os.altsep)[2]
+        return self._excluded_re.search(filename.lower()) is None
+
+    def _check_extension(self, file_path: str) -> bool:
+        """Check if the file extension is a photo format (constants.PHOTO_EXTENSIONS)."""
+        return os.path.splitext(file_path)[1].lower() in self._allowed_extensions
+
+    def _check_file_size(self, file_size: int) -> bool:
+        """Check if file size (in bytes, from os.stat) meets minimum requirement."""
+        return file_size >= self.min_file_size
+
+    def _check_dimensions(self, width: int, height: int, file_path: str) -> bool:
+        """Check if image dimensions are within acceptable range."""
         if width < self.min_width or height < self.min_height:
-            logger.debug(f"Dimensions too small: {width}x{height} for {file_path}")
+            logger.debug("Dimensions too small: %dx%d for %s", width, height, file_path)
             return False
 
         if width > self.max_width or height > self.max_height:
-            logger.debug(f"Dimensions too large: {width}x{height} for {file_path}")
+            logger.debug("Dimensions too large: %dx%d for %s", width, height, file_path)
             return False
 
         return True
 
-    def _check_square_icon(self, img: Image.Image, file_path: str) -> bool:
+    def _check_square_icon(self, width: int, height: int, file_path: str) -> bool:
         """Check if image is a small square (likely an icon)."""
-        width, height = img.size
-
         # If it's a perfect square smaller than threshold, it's likely an icon
         if width == height and width < self.exclude_square_smaller_than:
-            logger.debug(f"Small square icon detected: {width}x{height} for {file_path}")
+            logger.debug("Small square icon detected: %dx%d for %s", width, height, file_path)
             return False
 
         return True
 
-    def _check_exif(self, img: Image.Image, file_path: str) -> bool:
-        """Check if image has EXIF data (camera metadata)."""
-        try:
-            exif_data = img._getexif()
-            if exif_data is None or len(exif_data) == 0:
-                logger.debug(f"No EXIF data found: {file_path}")
-                return False
-            return True
-        except Exception:
-            # Some images don't support EXIF
-            logger.debug(f"Could not read EXIF data: {file_path}")
-            return False
-
     def get_filter_reason(self, file_path: str) -> Optional[str]:
         """
         Get the reason why a file was filtered (for reporting).
@@ -190,26 +452,42 @@ class PhotoFilter:
         if not self.enabled:
             return None
 
-        if not self._check_filename(file_path):
-            return "filename_pattern"
+        # Reuse the result when called right after is_photo/filter_batch for the same file
+        details = self._last_results.get(file_path)
+        if details is None:
+            details = self._inspect(file_path)
+        return details[0]
 
-        if not self._check_file_size(file_path):
-            return "file_size_too_small"
+    def get_filter_details(self, file_path: str) -> Tuple[Optional[str], int, int, Optional[bool]]:
+        """
+        Get the filter reason and the image properties read while checking a file (for reporting).
 
-        try:
-            with Image.open(file_path) as img:
-                if not self._check_dimensions(img, file_path):
-                    return "dimensions_out_of_range"
+        Reuses the result of the last is_photo/filter_batch call for the file. Files rejected
+        before their header was needed (filename, extension, size) have it read here, once.
+
+        Parameters:
+            file_path (str): Path to check
 
-                if not self._check_square_icon(img, file_path):
-                    return "small_square_icon"
+        Returns:
+            tuple: (reason, width, height, has_exif)
+                - reason: filter reason, or None if the file is a photo
+                - width, height: image size, or 0 if the image could not be read
+                - has_exif: EXIF presence, or None if it was not checked
+        """
+        details = self._last_results.get(file_path)
+        if details is None:
+            details = self._inspect(file_path)
 
-                if self.require_exif and not self._check_exif(img, file_path):
-                    return "missing_exif_data"
-        except Exception:
-            return "image_read_error"
+        reason = details[0]
+        if reason in _HEADER_NOT_READ:
+            try:
+                st = os.stat(file_path)
+                width, height, has_exif = _read_header(file_path, st.st_mtime_ns, st.st_size, True)
+                return reason, width, height, has_exif
+            except Exception:
+                return reason, 0, 0, None
 
-        return None
+        return details
 
     def get_statistics(self) -> dict:
         """
@@ -218,20 +496,23 @@ class PhotoFilter:
         Returns:
             dict: Statistics about filtered files
         """
-        total_filtered = (self.filtered_by_size + self.filtered_by_dimensions +
-                         self.filtered_by_square + self.filtered_by_exif +
-                         self.filtered_by_filename + self.filtered_by_read_error)
+        with self._stats_lock:
+            counts = self._counts.tolist()
+
+        total_checked = sum(counts)
+        total_passed = counts[FilterReason.PASSED]
 
         return {
-            'total_checked': self.total_checked,
-            'total_filtered': total_filtered,
-            'total_passed': self.total_checked - total_filtered,
-            'filtered_by_size': self.filtered_by_size,
-            'filtered_by_dimensions': self.filtered_by_dimensions,
-            'filtered_by_square': self.filtered_by_square,
-            'filtered_by_exif': self.filtered_by_exif,
-            'filtered_by_filename': self.filtered_by_filename,
-            'filtered_by_read_error': self.filtered_by_read_error,
+            'total_checked': total_checked,
+            'total_filtered': total_checked - total_passed,
+            'total_passed': total_passed,
+            'filtered_by_size': counts[FilterReason.SIZE],
+            'filtered_by_dimensions': counts[FilterReason.DIMENSIONS],
+            'filtered_by_square': counts[FilterReason.SQUARE],
+            'filtered_by_exif': counts[FilterReason.EXIF],
+            'filtered_by_filename': counts[FilterReason.FILENAME],
+            'filtered_by_extension': counts[FilterReason.EXTENSION],
+            'filtered_by_read_error': counts[FilterReason.READ_ERROR],
         }
 
     def print_statistics(self):
@@ -250,6 +531,7 @@ class PhotoFilter:
         logger.info(f"  Small square icon:     {stats['filtered_by_square']}")
         logger.info(f"  Missing EXIF data:     {stats['filtered_by_exif']}")
         logger.info(f"  Filename pattern:      {stats['filtered_by_filename']}")
+        logger.info(f"  Not a photo extension: {stats['filtered_by_extension']}")
         logger.info(f"  Image read error:      {stats['filtered_by_read_error']}")
         logger.info("=" * 70)
 
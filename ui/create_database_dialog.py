@@ -10,9 +10,47 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
 from PySide6.QtCore import Qt
 from database_metadata import DatabaseMetadata
 import os
+import stat
 from pathlib import Path
 
 
+class _SafeFilenameTable(dict):
+    """
+    str.translate table for database filenames, filled in as characters are seen.
+
+    Letters and digits (any script) plus '-' and '_' are kept, spaces become '_'
+    and everything else is dropped.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if char == ' ':
+            value = '_'
+        elif char.isalnum() or char in ('-', '_'):
+            value = codepoint
+        else:
+            value = None
+        self[codepoint] = value
+        return value
+
+
+_SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+
+def _stat_is_dir(path):
+    """
+    Classify a path with a single os.stat call.
+
+    Returns:
+        bool or None: True if it is a directory, False if it exists but is not one,
+        None if it does not exist (or cannot be accessed, like os.path.exists)
+    """
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return None
+
+
 class CreateDatabaseDialog(QDialog):
     """Dialog for creating a new database."""
 
@@ -191,9 +229,8 @@ class CreateDatabaseDialog(QDialog):
         """Update the database filename based on the name."""
         name = self.name_edit.text().strip()
         if name:
-            # Create safe filename from name
-            safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_'))
-            safe_name = safe_name.replace(' ', '_')
+            # Create safe filename from name - one C-level pass over the text
+            safe_name = name.translate(_SAFE_FILENAME_TABLE)
             filename = f"PhotoDB_{safe_name}.db"
             self.filename_label.setText(filename)
         else:
@@ -295,7 +332,16 @@ class CreateDatabaseDialog(QDialog):
                 return False
 
         # Check if archive location exists, offer to create it
-        if not os.path.exists(archive):
+        archive_is_dir = _stat_is_dir(archive)
+        if archive_is_dir is False:
+            QMessageBox.warning(
+                self,
+                "Invalid Path",
+                f"The archive location is a file, not a folder:\n\n{archive}"
+            )
+            return False
+
+        if archive_is_dir is None:
             response = QMessageBox.question(
                 self,
                 "Create Archive Folder?",
@@ -319,7 +365,16 @@ class CreateDatabaseDialog(QDialog):
                 return False
 
         # Check if video archive location exists (if enabled), offer to create it
-        if separate_video and video_archive and not os.path.exists(video_archive):
+        video_is_dir = _stat_is_dir(video_archive) if separate_video and video_archive else True
+        if video_is_dir is False:
+            QMessageBox.warning(
+                self,
+                "Invalid Path",
+                f"The video archive location is a file, not a folder:\n\n{video_archive}"
+            )
+            return False
+
+        if video_is_dir is None:
             response = QMessageBox.question(
                 self,
                 "Create Video Archive Folder?",
@@ -7,11 +7,30 @@ Allows users to select an existing database or create a new one.
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                QPushButton, QListWidget, QListWidgetItem,
                                QMessageBox, QTextEdit, QApplication)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QThread
 from database_metadata import DatabaseMetadata
+import constants
 import os
 
 
+class DatabaseScanWorker(QThread):
+    """Worker thread that finds the available databases without blocking the dialog."""
+
+    databases_found = Signal(list)  # batch of database info dicts, sent as they are found
+
+    def run(self):
+        """Scan for databases (runs in background thread)."""
+        batch = []
+        for db in DatabaseMetadata.iter_databases():
+            batch.append(db)
+            if len(batch) >= constants.DATABASE_SCAN_BATCH_SIZE:
+                self.databases_found.emit(batch)
+                batch = []
+
+        if batch:
+            self.databases_found.emit(batch)
+
+
 class DatabaseSelectorDialog(QDialog):
     """Dialog for selecting or creating a database."""
 
@@ -20,6 +39,10 @@ class DatabaseSelectorDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_database = None
+        self.databases = []
+        self._scan_worker = None
+        self._open_after_load = None  # Path of a database to open once the scan finishes
+        self._item_text_cache = {}  # (path, name, archive, photos) -> list item text
         self.init_ui()
         self.load_databases()
 
@@ -108,11 +131,50 @@ class DatabaseSelectorDialog(QDialog):
                 self.move(dialog_geometry.topLeft())
 
     def load_databases(self):
-        """Load and display available databases."""
-        self.database_list.clear()
-        self.databases = DatabaseMetadata.find_databases()
+        """Start scanning for databases; the list fills in as add_databases receives them."""
+        self._stop_scan()
 
+        self.database_list.clear()
+        self.databases = []
+        item = QListWidgetItem("Loading databases...")
+        item.setFlags(Qt.ItemIsEnabled)  # Not selectable
+        item.setForeground(Qt.gray)
+        self.database_list.addItem(item)
+
+        # Signals from the worker thread are queued, so batches arrive before finished
+        self._scan_worker = DatabaseScanWorker()
+        self._scan_worker.databases_found.connect(self.add_databases)
+        self._scan_worker.finished.connect(self.on_scan_finished)
+        self._scan_worker.start()
+
+    def _stop_scan(self):
+        """Wait for a running scan and drop its result."""
+        if self._scan_worker is not None:
+            self._scan_worker.databases_found.disconnect(self.add_databases)
+            self._scan_worker.finished.disconnect(self.on_scan_finished)
+            self._scan_worker.wait()
+            self._scan_worker = None
+
+    def add_databases(self, databases):
+        """Append a batch of databases found by the scan to the list."""
+        if not self.databases:
+            self.database_list.clear()  # Remove the "Loading" placeholder
+        self.databases.extend(databases)
+
+        # Repaint once after the batch is added, not once per item
+        self.database_list.setUpdatesEnabled(False)
+        try:
+            for db in databases:
+                item = QListWidgetItem(self._item_text(db))
+                item.setData(Qt.UserRole, db)  # Store database info
+                self.database_list.addItem(item)
+        finally:
+            self.database_list.setUpdatesEnabled(True)
+
+    def on_scan_finished(self):
+        """Handle the end of the database scan."""
         if not self.databases:
+            self.database_list.clear()
             item = QListWidgetItem("No databases found. Click 'Create New Database' to get started.")
             item.setFlags(Qt.ItemIsEnabled)  # Not selectable
             item.setForeground(Qt.gray)
@@ -120,15 +182,32 @@ class DatabaseSelectorDialog(QDialog):
             self.info_panel.setPlainText("No databases available.")
             return
 
-        for db in self.databases:
-            name = db.get('database_name', 'Unnamed Database')
-            archive = db.get('archive_location', 'Unknown')
-            photos = db.get('total_photos', 0)
+        if self._open_after_load:
+            self.select_and_open(self._open_after_load)
+
+    def _item_text(self, db):
+        """Return the list text for a database, reusing it across reloads if unchanged."""
+        name = db.get('database_name', 'Unnamed Database')
+        archive = db.get('archive_location', 'Unknown')
+        photos = db.get('total_photos', 0)
 
+        key = (db.get('path'), name, archive, photos)
+        item_text = self._item_text_cache.get(key)
+        if item_text is None:
             item_text = f"{name}\n  Archive: {archive}\n  Photos: {photos:,}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, db)  # Store database info
-            self.database_list.addItem(item)
+            self._item_text_cache[key] = item_text
+        return item_text
+
+    def select_and_open(self, database_path):
+        """Select the listed database with the given path and open it."""
+        self._open_after_load = None
+        for i in range(self.database_list.count()):
+            item = self.database_list.item(i)
+            db_info = item.data(Qt.UserRole)
+            if db_info and db_info.get('path') == database_path:
+                self.database_list.setCurrentItem(item)
+                self.open_database(db_info)
+                break
 
     def on_selection_changed(self):
         """Handle database selection change."""
@@ -206,20 +285,14 @@ Database File: {db_info.get('filename', 'N/A')}
 
         dialog = CreateDatabaseDialog(self)
         if dialog.exec():
-            # Reload databases to show the new one
+            # Reload databases to show the new one, then auto-select and open it
+            self._open_after_load = dialog.created_database_path
             self.load_databases()
 
-            # Auto-select the newly created database
-            new_db_path = dialog.created_database_path
-            if new_db_path:
-                # Find and select the new database
-                for i in range(self.database_list.count()):
-                    item = self.database_list.item(i)
-                    db_info = item.data(Qt.UserRole)
-                    if db_info and db_info.get('path') == new_db_path:
-                        self.database_list.setCurrentItem(item)
-                        self.open_database(db_info)
-                        break
+    def done(self, result):
+        """Make sure the scan thread has finished before the dialog closes."""
+        self._stop_scan()
+        super().done(result)
 
     def get_selected_database(self):
         """Get the path of the selected database."""
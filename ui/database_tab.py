@@ -6,26 +6,107 @@ Displays database information and allows database management.
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                QPushButton, QGroupBox, QFormLayout, QLineEdit,
-                               QTextEdit, QMessageBox, QFileDialog, QCheckBox)
-from PySide6.QtCore import Qt, Signal
+                               QMessageBox, QFileDialog, QCheckBox)
+from PySide6.QtCore import Qt, Signal, QFileSystemWatcher, QThread, QLocale, QSignalBlocker, QTimer
 from database_metadata import DatabaseMetadata
+from ui.database_selector_dialog import DatabaseSelectorDialog
+import constants
 import os
+import time
+# Bound once for the refresh path (_folder_exists and the watcher callback)
+from os.path import exists as _exists, dirname as _dirname, isdir as _isdir
+
+
+# Status label styles by state - shared strings, so refreshing does not build new ones
+_STATUS_STYLES = {
+    "ok": "font-size: 10px; color: green; margin-top: 5px;",
+    "error": "font-size: 10px; color: red; margin-top: 5px;",
+    "warning": "font-size: 10px; color: orange; margin-top: 5px;",
+    "info": "font-size: 10px; color: #666; margin-top: 5px;",
+}
+_HINT_STYLE = "color: #666; font-size: 11px; margin-bottom: 5px;"
+_READ_ONLY_FIELD_STYLE = "background-color: #f5f5f5;"
+
+# Widget signals are connected once - a repeated connect must not add a second slot call
+_UNIQUE_CONNECTION = Qt.ConnectionType.UniqueConnection
+
+
+def _set_status(label, text, state):
+    """Set a status label's text and its _STATUS_STYLES style, restyling only on a state change."""
+    label.setText(text)
+    style = _STATUS_STYLES[state]
+    if label.styleSheet() != style:
+        label.setStyleSheet(style)
+
+
+class DatabaseLoadWorker(QThread):
+    """Worker thread that opens a database and loads its metadata without blocking the UI."""
+
+    loaded = Signal(str, object, object)  # database_path, DatabaseMetadata, metadata dict or None
+
+    def __init__(self, database_path):
+        super().__init__()
+        self.database_path = database_path
+
+    def run(self):
+        """Open the database and load its metadata (runs in background thread)."""
+        database_metadata = DatabaseMetadata(self.database_path)
+        metadata = database_metadata.get_metadata_bundle()
+        self.loaded.emit(self.database_path, database_metadata, metadata)
 
 
 class DatabaseTab(QWidget):
     """Tab for displaying and managing database information."""
 
     database_changed = Signal(str)  # Emits new database path
+    status_message = Signal(str, int)  # Informational message, timeout in ms - shown in the status bar
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.current_database_path = None
+        self._db_basename = None  # File name of current_database_path, shown by _update_display
         self.database_metadata = None
-        self.init_ui()
+        self._latest_metadata = None  # Last metadata bundle read, shown by showEvent once the widgets exist
+        self._last_display_snapshot = None  # What the widgets currently show, see refresh_database_info
+        self._load_workers = set()  # Running DatabaseLoadWorkers, kept alive until they finish
+        self._locale = QLocale.system()  # Formats the photo count with the user's digit grouping
+
+        # Archive folder existence: path -> (exists, time.monotonic() of the check).
+        # Archives may be on network shares, so each folder is stat'ed at most once per
+        # ARCHIVE_STATUS_CACHE_SECONDS unless the watcher reports a change first.
+        self._folder_exists_cache = {}
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_watched_directory_changed)
+
+        # Refresh requests are coalesced: rapid clicks on Refresh Statistics run one
+        # refresh (one database round trip) after the last click
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(constants.DATABASE_REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
+        # The widgets are built by init_ui on first show, so a tab that is never
+        # opened costs nothing at startup
+        self._ui_built = False
+        self.setLayout(QVBoxLayout())
+
+    def showEvent(self, event):
+        """Build the user interface the first time the tab is shown."""
+        if not self._ui_built:
+            self.init_ui()
+            self._ui_built = True
+            # Show what DatabaseLoadWorker already read - no database query on the UI thread
+            if self._latest_metadata is not None:
+                self._show_metadata(self._latest_metadata)
+            elif self.current_database_path and self.database_metadata is None:
+                self.db_name_label.setText("Loading...")  # _on_database_loaded shows the result
+            else:
+                self.clear_display()
+        super().showEvent(event)
 
     def init_ui(self):
         """Initialize the user interface."""
-        layout = QVBoxLayout()
+        layout = self.layout()
 
         # Header
         header = QLabel("Database Management")
@@ -56,10 +137,13 @@ class DatabaseTab(QWidget):
         desc_group = QGroupBox("Description")
         desc_layout = QVBoxLayout()
 
-        self.description_display = QTextEdit()
-        self.description_display.setReadOnly(True)
+        # A plain label - the description is short, read-only text
+        self.description_display = QLabel("No description")
+        self.description_display.setTextFormat(Qt.PlainText)
+        self.description_display.setWordWrap(True)
+        self.description_display.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        self.description_display.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.description_display.setMaximumHeight(80)
-        self.description_display.setPlaceholderText("No description")
         self.description_display.setStyleSheet("background-color: #f5f5f5; padding: 5px;")
         desc_layout.addWidget(self.description_display)
 
@@ -75,19 +159,19 @@ class DatabaseTab(QWidget):
             "This location is managed by the database and cannot be changed here."
         )
         archive_info.setWordWrap(True)
-        archive_info.setStyleSheet("color: #666; font-size: 11px; margin-bottom: 5px;")
+        archive_info.setStyleSheet(_HINT_STYLE)
         archive_layout.addWidget(archive_info)
 
         archive_path_layout = QHBoxLayout()
         self.archive_path_edit = QLineEdit()
         self.archive_path_edit.setReadOnly(True)
         self.archive_path_edit.setPlaceholderText("No archive location set")
-        self.archive_path_edit.setStyleSheet("background-color: #f5f5f5;")
+        self.archive_path_edit.setStyleSheet(_READ_ONLY_FIELD_STYLE)
         archive_path_layout.addWidget(self.archive_path_edit)
 
         self.browse_archive_btn = QPushButton("Browse...")
         self.browse_archive_btn.setToolTip("Archive location is managed by the database")
-        self.browse_archive_btn.clicked.connect(self.on_browse_archive_clicked)
+        self.browse_archive_btn.clicked.connect(self.on_browse_archive_clicked, type=_UNIQUE_CONNECTION)
         archive_path_layout.addWidget(self.browse_archive_btn)
 
         archive_layout.addLayout(archive_path_layout)
@@ -95,7 +179,7 @@ class DatabaseTab(QWidget):
         # Archive status
         self.archive_status_label = QLabel("")
         self.archive_status_label.setWordWrap(True)
-        self.archive_status_label.setStyleSheet("font-size: 10px; color: #666; margin-top: 5px;")
+        self.archive_status_label.setStyleSheet(_STATUS_STYLES["info"])
         archive_layout.addWidget(self.archive_status_label)
 
         archive_group.setLayout(archive_layout)
@@ -110,7 +194,7 @@ class DatabaseTab(QWidget):
         self.separate_video_archive_check.setToolTip(
             "When enabled, video files will be organized to a different location than photos"
         )
-        self.separate_video_archive_check.stateChanged.connect(self.on_separate_video_changed)
+        self.separate_video_archive_check.stateChanged.connect(self.on_separate_video_changed, type=_UNIQUE_CONNECTION)
         video_archive_layout.addWidget(self.separate_video_archive_check)
 
         video_archive_info = QLabel(
@@ -118,25 +202,25 @@ class DatabaseTab(QWidget):
             "when you want photos and videos in different locations."
         )
         video_archive_info.setWordWrap(True)
-        video_archive_info.setStyleSheet("color: #666; font-size: 11px; margin-bottom: 5px;")
+        video_archive_info.setStyleSheet(_HINT_STYLE)
         video_archive_layout.addWidget(video_archive_info)
 
         video_archive_path_layout = QHBoxLayout()
         self.video_archive_path_edit = QLineEdit()
         self.video_archive_path_edit.setReadOnly(True)
         self.video_archive_path_edit.setPlaceholderText("No video archive location set")
-        self.video_archive_path_edit.setStyleSheet("background-color: #f5f5f5;")
+        self.video_archive_path_edit.setStyleSheet(_READ_ONLY_FIELD_STYLE)
         video_archive_path_layout.addWidget(self.video_archive_path_edit)
 
         self.browse_video_archive_btn = QPushButton("Browse...")
         self.browse_video_archive_btn.setEnabled(False)
-        self.browse_video_archive_btn.clicked.connect(self.on_browse_video_archive_clicked)
+        self.browse_video_archive_btn.clicked.connect(self.on_browse_video_archive_clicked, type=_UNIQUE_CONNECTION)
         video_archive_path_layout.addWidget(self.browse_video_archive_btn)
 
         self.set_video_archive_btn = QPushButton("Set")
         self.set_video_archive_btn.setEnabled(False)
         self.set_video_archive_btn.setToolTip("Apply the selected video archive location")
-        self.set_video_archive_btn.clicked.connect(self.on_set_video_archive_clicked)
+        self.set_video_archive_btn.clicked.connect(self.on_set_video_archive_clicked, type=_UNIQUE_CONNECTION)
         video_archive_path_layout.addWidget(self.set_video_archive_btn)
 
         video_archive_layout.addLayout(video_archive_path_layout)
@@ -144,7 +228,7 @@ class DatabaseTab(QWidget):
         # Video archive status
         self.video_archive_status_label = QLabel("")
         self.video_archive_status_label.setWordWrap(True)
-        self.video_archive_status_label.setStyleSheet("font-size: 10px; color: #666; margin-top: 5px;")
+        self.video_archive_status_label.setStyleSheet(_STATUS_STYLES["info"])
         video_archive_layout.addWidget(self.video_archive_status_label)
 
         video_archive_group.setLayout(video_archive_layout)
@@ -170,17 +254,17 @@ class DatabaseTab(QWidget):
         self.change_archive_btn = QPushButton("Change Archive Location")
         self.change_archive_btn.setMinimumHeight(35)
         self.change_archive_btn.setToolTip("Change where organized photos are stored (Coming Soon)")
-        self.change_archive_btn.clicked.connect(self.on_change_archive_clicked)
+        self.change_archive_btn.clicked.connect(self.on_change_archive_clicked, type=_UNIQUE_CONNECTION)
         button_layout.addWidget(self.change_archive_btn)
 
         self.change_database_btn = QPushButton("Select Different Database")
         self.change_database_btn.setMinimumHeight(35)
-        self.change_database_btn.clicked.connect(self.on_change_database_clicked)
+        self.change_database_btn.clicked.connect(self.on_change_database_clicked, type=_UNIQUE_CONNECTION)
         button_layout.addWidget(self.change_database_btn)
 
         self.refresh_btn = QPushButton("Refresh Statistics")
         self.refresh_btn.setMinimumHeight(35)
-        self.refresh_btn.clicked.connect(self.refresh_database_info)
+        self.refresh_btn.clicked.connect(self.refresh_database_info, type=_UNIQUE_CONNECTION)
         button_layout.addWidget(self.refresh_btn)
 
         layout.addLayout(button_layout)
@@ -188,8 +272,6 @@ class DatabaseTab(QWidget):
         # Spacer
         layout.addStretch()
 
-        self.setLayout(layout)
-
     def set_database(self, database_path):
         """
         Set the current database and load its information.
@@ -206,20 +288,55 @@ class DatabaseTab(QWidget):
             return
 
         self.current_database_path = database_path
-        self.database_metadata = DatabaseMetadata(database_path)
-        self.refresh_database_info()
+        self._db_basename = os.path.basename(database_path)
+        self.database_metadata = None
+        self._latest_metadata = None
+        self._last_display_snapshot = None
+        if self._ui_built:
+            self.db_name_label.setText("Loading...")
+
+        # Opening the database and reading its metadata happens on a worker thread;
+        # _on_database_loaded shows the result
+        worker = DatabaseLoadWorker(database_path)
+        worker.loaded.connect(self._on_database_loaded)
+        worker.finished.connect(lambda: self._load_workers.discard(worker))
+        self._load_workers.add(worker)
+        worker.start()
+
+    def _on_database_loaded(self, database_path, database_metadata, metadata):
+        """Show a database loaded by DatabaseLoadWorker."""
+        if database_path != self.current_database_path:
+            return  # Another database was selected while this one loaded
+
+        self.database_metadata = database_metadata
+        self._show_metadata(metadata)
 
     def refresh_database_info(self):
-        """Refresh the database information display."""
+        """Request a refresh of the database information display.
+
+        Requests arriving within DATABASE_REFRESH_DEBOUNCE_MS of each other run a
+        single refresh after the last one.
+        """
+        self._refresh_timer.start()
+
+    def _do_refresh(self):
+        """Refresh the database information display now."""
+        self._refresh_timer.stop()
         if not self.current_database_path or not self.database_metadata:
             self.clear_display()
             return
 
-        # Refresh the total photos count from UniquePhotos table
-        self.database_metadata.refresh_total_photos()
+        # Recount photos from the UniquePhotos table, read the metadata and
+        # update the last used timestamp - one database round trip
+        self._show_metadata(self.database_metadata.get_metadata_bundle())
 
-        metadata = self.database_metadata.get_metadata()
+    def _show_metadata(self, metadata):
+        """
+        Display metadata from DatabaseMetadata.get_metadata_bundle().
 
+        Args:
+            metadata: Metadata dictionary, or None if it could not be loaded
+        """
         if not metadata:
             QMessageBox.warning(
                 self,
@@ -230,88 +347,182 @@ class DatabaseTab(QWidget):
             self.clear_display()
             return
 
+        self._latest_metadata = metadata
+        if not self._ui_built:
+            return  # Displayed by showEvent once the widgets exist
+
+        archive_location = metadata.get('archive_location', '')
+        video_archive_location = metadata.get('video_archive_location', '')
+
+        # Check each distinct archive folder once - they may be on slow network shares
+        folder_exists = {
+            path: self._folder_exists(path)
+            for path in {archive_location, video_archive_location} if path
+        }
+
+        # Skip the widget updates if nothing shown has changed since the last refresh.
+        # last_used_date changes on every refresh but only its date part
+        # (last_used_short) is displayed.
+        snapshot = (
+            self.current_database_path,
+            dict(metadata, last_used_date=None),
+            folder_exists,
+        )
+        if snapshot != self._last_display_snapshot:
+            self._last_display_snapshot = snapshot
+            # Lay out and repaint once for all the label changes, not once per label
+            self.setUpdatesEnabled(False)
+            try:
+                self._update_display(metadata, folder_exists)
+            finally:
+                self.setUpdatesEnabled(True)
+
+    def _folder_exists(self, path):
+        """
+        Check whether an archive folder exists, using the cached result while it is fresh.
+
+        Args:
+            path: Folder path
+
+        Returns:
+            True if the folder exists
+        """
+        now = time.monotonic()
+        cached = self._folder_exists_cache.get(path)
+        if cached is not None and now - cached[1] < constants.ARCHIVE_STATUS_CACHE_SECONDS:
+            return cached[0]
+
+        exists = _exists(path)
+        self._folder_exists_cache[path] = (exists, now)
+
+        # Watch the folder and its parent, so creating or deleting it invalidates the cache
+        watched = set(self._fs_watcher.directories())
+        for watch_path in (path, _dirname(path)):
+            if watch_path and watch_path not in watched and _isdir(watch_path):
+                self._fs_watcher.addPath(watch_path)
+        return exists
+
+    def _on_watched_directory_changed(self, changed_path):
+        """Forget cached existence checks for a changed folder and its children."""
+        for path in list(self._folder_exists_cache):
+            if path == changed_path or _dirname(path) == changed_path:
+                del self._folder_exists_cache[path]
+
+    def _update_display(self, metadata, folder_exists):
+        """
+        Show database metadata in the widgets.
+
+        Args:
+            metadata: Dictionary from DatabaseMetadata.get_metadata()
+            folder_exists: Dictionary of archive folder path -> whether it exists
+        """
         # Update database info
         self.db_name_label.setText(metadata.get('database_name', 'Unknown'))
-        self.db_file_label.setText(os.path.basename(self.current_database_path))
+        self.db_file_label.setText(self._db_basename)
 
-        created_date = metadata.get('created_date', 'Unknown')
-        if created_date and created_date != 'Unknown':
-            self.db_created_label.setText(created_date[:10])  # Just the date part
-        else:
-            self.db_created_label.setText('Unknown')
-
-        last_used = metadata.get('last_used_date', 'Never')
-        if last_used and last_used != 'Never':
-            self.db_last_used_label.setText(last_used[:10])
-        else:
-            self.db_last_used_label.setText('Never')
+        # Just the date parts, trimmed by the metadata query
+        self.db_created_label.setText(metadata.get('created_date_short') or 'Unknown')
+        self.db_last_used_label.setText(metadata.get('last_used_short') or 'Never')
 
         # Update description
         description = metadata.get('description', '')
         if description:
-            self.description_display.setPlainText(description)
+            self.description_display.setText(description)
         else:
-            self.description_display.setPlainText("No description provided")
+            self.description_display.setText("No description provided")
 
         # Update archive location
         archive_location = metadata.get('archive_location', '')
         self.archive_path_edit.setText(archive_location)
 
         # Check if archive exists
-        if archive_location and os.path.exists(archive_location):
-            self.archive_status_label.setText("✓ Archive folder exists")
-            self.archive_status_label.setStyleSheet("font-size: 10px; color: green; margin-top: 5px;")
+        if archive_location and folder_exists[archive_location]:
+            _set_status(self.archive_status_label, "✓ Archive folder exists", "ok")
         elif archive_location:
-            self.archive_status_label.setText("⚠ Warning: Archive folder does not exist!")
-            self.archive_status_label.setStyleSheet("font-size: 10px; color: red; margin-top: 5px;")
+            _set_status(self.archive_status_label, "⚠ Warning: Archive folder does not exist!", "error")
         else:
-            self.archive_status_label.setText("No archive location set")
-            self.archive_status_label.setStyleSheet("font-size: 10px; color: orange; margin-top: 5px;")
+            _set_status(self.archive_status_label, "No archive location set", "warning")
 
         # Update statistics
         total_photos = metadata.get('total_photos', 0)
-        self.total_photos_label.setText(f"{total_photos:,}")
+        self.total_photos_label.setText(self._locale.toString(int(total_photos)))
 
         schema_version = metadata.get('schema_version', 1)
         self.schema_version_label.setText(str(schema_version))
 
         # Update video archive information
-        video_archive_location = metadata.get('video_archive_location', '')
-        separate_video_archive = metadata.get('separate_video_archive', False)
+        self._update_video_archive_display(
+            metadata.get('video_archive_location', ''),
+            metadata.get('separate_video_archive', False)
+        )
+
+    def _update_video_archive_display(self, video_archive_location, separate_video_archive):
+        """
+        Show the video archive settings - only the widgets of the video archive group.
 
-        self.separate_video_archive_check.setChecked(separate_video_archive)
+        Args:
+            video_archive_location: Video archive folder, or empty/None if not set
+            separate_video_archive: Whether videos are stored separately
+        """
+        # Blocked so showing the stored state does not run on_separate_video_changed,
+        # which would write the database again
+        with QSignalBlocker(self.separate_video_archive_check):
+            self.separate_video_archive_check.setChecked(separate_video_archive)
+        self.browse_video_archive_btn.setEnabled(separate_video_archive)
         self.video_archive_path_edit.setText(video_archive_location if video_archive_location else "")
 
         # Update video archive status
         if separate_video_archive and video_archive_location:
-            if os.path.exists(video_archive_location):
-                self.video_archive_status_label.setText("✓ Video archive folder exists")
-                self.video_archive_status_label.setStyleSheet("font-size: 10px; color: green; margin-top: 5px;")
+            if self._folder_exists(video_archive_location):
+                _set_status(self.video_archive_status_label, "✓ Video archive folder exists", "ok")
             else:
-                self.video_archive_status_label.setText("⚠ Warning: Video archive folder does not exist!")
-                self.video_archive_status_label.setStyleSheet("font-size: 10px; color: red; margin-top: 5px;")
+                _set_status(self.video_archive_status_label, "⚠ Warning: Video archive folder does not exist!", "error")
         elif separate_video_archive:
-            self.video_archive_status_label.setText("⚠ Separate video archive enabled but no location set")
-            self.video_archive_status_label.setStyleSheet("font-size: 10px; color: orange; margin-top: 5px;")
+            _set_status(self.video_archive_status_label, "⚠ Separate video archive enabled but no location set", "warning")
         else:
-            self.video_archive_status_label.setText("Videos will be stored in the same location as photos")
-            self.video_archive_status_label.setStyleSheet("font-size: 10px; color: #666; margin-top: 5px;")
+            _set_status(self.video_archive_status_label, "Videos will be stored in the same location as photos", "info")
 
-        # Update last used timestamp
-        self.database_metadata.update_last_used()
+    def _apply_video_archive_state(self, video_archive_location, separate_video_archive):
+        """
+        Show video archive settings just written to the database, without reloading it.
+
+        The display snapshot is updated to match, so the next refresh does not
+        redraw the tab just because the video archive settings changed here.
+
+        Args:
+            video_archive_location: Video archive folder as stored, or None
+            separate_video_archive: Whether videos are stored separately
+        """
+        self._update_video_archive_display(video_archive_location, separate_video_archive)
+
+        if self._last_display_snapshot is not None:
+            database_path, shown, folder_exists = self._last_display_snapshot
+            shown = dict(shown, video_archive_location=video_archive_location,
+                         separate_video_archive=separate_video_archive)
+            folder_exists = {
+                path: self._folder_exists(path)
+                for path in {shown.get('archive_location'), video_archive_location} if path
+            }
+            self._last_display_snapshot = (database_path, shown, folder_exists)
 
     def clear_display(self):
         """Clear all displayed information."""
+        self._latest_metadata = None
+        self._last_display_snapshot = None
+        if not self._ui_built:
+            return
         self.db_name_label.setText("No database loaded")
         self.db_file_label.setText("-")
         self.db_created_label.setText("-")
         self.db_last_used_label.setText("-")
-        self.description_display.clear()
+        self.description_display.setText("No description")
         self.archive_path_edit.clear()
         self.archive_status_label.clear()
         self.video_archive_path_edit.clear()
         self.video_archive_status_label.clear()
-        self.separate_video_archive_check.setChecked(False)
+        with QSignalBlocker(self.separate_video_archive_check):
+            self.separate_video_archive_check.setChecked(False)
+        self.browse_video_archive_btn.setEnabled(False)
         self.total_photos_label.setText("0")
         self.schema_version_label.setText("-")
 
@@ -345,8 +556,6 @@ class DatabaseTab(QWidget):
 
     def on_change_database_clicked(self):
         """Handle change database button click."""
-        from ui.database_selector_dialog import DatabaseSelectorDialog
-
         dialog = DatabaseSelectorDialog(self)
         if dialog.exec():
             new_db_path = dialog.get_selected_database()
@@ -373,12 +582,13 @@ class DatabaseTab(QWidget):
             # Disable separate video archive in database
             if self.database_metadata:
                 try:
-                    self.database_metadata.set_video_archive("", enabled=False)
-                    self.refresh_database_info()
-                    QMessageBox.information(
-                        self,
-                        "Video Archive Disabled",
-                        "Videos will now be stored in the same location as photos."
+                    result = self.database_metadata.set_video_archive("", enabled=False)
+                    if result is None:
+                        raise RuntimeError("The database could not be updated.")
+                    self._apply_video_archive_state(*result)
+                    self.status_message.emit(
+                        "Video archive disabled - videos will now be stored in the same location as photos",
+                        constants.STATUS_MESSAGE_TIMEOUT_MS
                     )
                 except Exception as e:
                     QMessageBox.critical(
@@ -391,10 +601,16 @@ class DatabaseTab(QWidget):
 
     def on_browse_video_archive_clicked(self):
         """Handle browse video archive button click."""
+        # Directories only, without custom folder icons or symlink resolution - the
+        # dialog would otherwise stat every entry of the start folder, which can take
+        # minutes on network home directories
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Video Archive Location",
-            os.path.expanduser("~")
+            os.path.expanduser("~"),
+            QFileDialog.Option.ShowDirsOnly
+            | QFileDialog.Option.DontUseCustomDirectoryIcons
+            | QFileDialog.Option.DontResolveSymlinks
         )
 
         if folder:
@@ -449,15 +665,18 @@ class DatabaseTab(QWidget):
 
         # Set video archive in database
         try:
-            self.database_metadata.set_video_archive(video_archive_location, enabled=True)
-            self.refresh_database_info()
+            result = self.database_metadata.set_video_archive(video_archive_location, enabled=True)
+            # The folder may have just been created - don't show a cached "does not exist"
+            self._folder_exists_cache.pop(video_archive_location, None)
+            if result is None:
+                raise RuntimeError("The database could not be updated.")
+            self._apply_video_archive_state(*result)
             self.set_video_archive_btn.setEnabled(False)
 
-            QMessageBox.information(
-                self,
-                "Video Archive Set",
-                f"Video archive location has been set:\n\n{video_archive_location}\n\n"
-                f"Videos will now be organized to this location."
+            self.status_message.emit(
+                f"Video archive location set: {video_archive_location} - "
+                f"videos will now be organized to this location",
+                constants.STATUS_MESSAGE_TIMEOUT_MS
             )
         except Exception as e:
             QMessageBox.critical(
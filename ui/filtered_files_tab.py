@@ -6,15 +6,375 @@ and view their attributes and preview.
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-                               QTableWidget, QTableWidgetItem, QPushButton,
+                               QTableView, QPushButton, QAbstractItemView,
                                QLabel, QTextEdit, QSplitter, QHeaderView,
-                               QFileDialog, QMessageBox, QApplication, QComboBox)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap, QImage
+                               QFileDialog, QMessageBox, QApplication, QComboBox,
+                               QProgressDialog)
+from PySide6.QtCore import (Qt, Signal, QAbstractTableModel, QModelIndex, QStandardPaths, QTimer, QThread,
+                            QSignalBlocker, QSize)
+from PySide6.QtGui import QPixmap, QImage, QColor, QImageReader
+from array import array
+import constants
+import csv
+import functools
+import hashlib
+import itertools
 import os
 from pathlib import Path
-from PIL import Image
-import subprocess
+import sys
+# PIL and subprocess are imported where they are used. Previews are decoded by Qt;
+# PIL is only loaded by PreviewLoadWorker for formats Qt cannot read (off the UI
+# thread) and to read the format and mode shown in the details panel
+
+# Extensions that get a rough preview while the full one loads - JPEG decodes at 1/8 scale
+_QUICK_PREVIEW_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.jpe', '.jfif'})
+
+
+def _thumbnail_cache_dir():
+    """
+    Get the folder preview thumbnails are cached in, creating it if needed.
+
+    Returns:
+        Path of the folder, or None if there is no writable cache location
+    """
+    location = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    if not location:
+        return None
+    cache_dir = Path(location) / "filtered_thumbs"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return cache_dir
+
+
+def _thumbnail_cache_path(cache_dir, file_path, stat_result, target_size):
+    """
+    Get the cached thumbnail path for a file.
+
+    The name is a hash of the path, modification time and size, so an edited
+    file gets a new thumbnail instead of a stale one, and of the thumbnail's
+    target size in device pixels, which depends on the display scaling.
+    """
+    key = (f"{file_path}|{stat_result.st_mtime_ns}|{stat_result.st_size}|"
+           f"{target_size[0]}x{target_size[1]}").encode("utf-8", "surrogatepass")
+    return cache_dir / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.jpg"
+
+
+@functools.lru_cache(maxsize=constants.PREVIEW_PIXMAP_CACHE_SIZE)
+def _load_thumbnail_pixmap(thumbnail_path):
+    """Load a cached thumbnail, keeping recently shown ones in memory."""
+    return QPixmap(thumbnail_path)
+
+
+def _image_format_and_mode(file_path):
+    """
+    Read an image's format and mode (e.g. "JPEG", "RGB") from its header.
+
+    The scan does not record them, so the details panel reads them for the file
+    being viewed. Image.open only parses the header; nothing is decoded.
+
+    Returns:
+        (format, mode), or ("Unknown", "Unknown") if the file cannot be read
+    """
+    try:
+        from PIL import Image
+        with Image.open(file_path) as img:
+            return img.format or "Unknown", img.mode
+    except Exception:
+        return "Unknown", "Unknown"
+
+
+class PreviewLoadWorker(QThread):
+    """Worker thread that decodes a preview image without blocking the UI."""
+
+    # request id, saved thumbnail path or None, QImage or (pixels, width, height) or None, error message
+    loaded = Signal(int, object, object, str)
+
+    def __init__(self, request_id, file_path, thumbnail_path, target_size):
+        """
+        Args:
+            request_id: Identifies the preview request, passed back with the result
+            file_path: Image to preview
+            thumbnail_path: Where to cache the thumbnail, or None to not cache it
+            target_size: (width, height) in device pixels the preview must fit in
+        """
+        super().__init__()
+        self.request_id = request_id
+        self.file_path = file_path
+        self.thumbnail_path = thumbnail_path
+        self.target_size = target_size
+
+    def _read_with_qt(self):
+        """
+        Decode the image with Qt's own readers, at preview size.
+
+        For JPEGs the scaled size is decoded directly (scaled IDCT), without PIL.
+
+        Returns:
+            QImage, or None if Qt cannot read the file
+        """
+        target_width, target_height = self.target_size
+        reader = QImageReader(self.file_path)
+        reader.setAutoTransform(True)  # Honor the EXIF orientation
+        size = reader.size()
+        if size.isValid() and (size.width() > target_width or size.height() > target_height):
+            size.scale(target_width, target_height, Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+        image = reader.read()
+        return None if image.isNull() else image
+
+    def run(self):
+        """Decode and shrink the image (runs in background thread)."""
+        try:
+            image = self._read_with_qt()
+            if image is not None:
+                if self.thumbnail_path is not None and image.save(
+                        self.thumbnail_path, "JPEG", constants.PREVIEW_THUMBNAIL_QUALITY):
+                    self.loaded.emit(self.request_id, self.thumbnail_path, None, "")
+                else:
+                    self.loaded.emit(self.request_id, None, image, "")
+                return
+
+            # Formats Qt has no reader for (e.g. HEIC, some TIFFs) - decode with PIL
+            from PIL import Image
+
+            # Closed as soon as the preview is decoded, so the source file is not held
+            # open (and locked on Windows) while the user moves or deletes it
+            with Image.open(self.file_path) as source:
+                # JPEGs can decode at 1/2, 1/4 or 1/8 scale - ask for at least twice the
+                # preview size so the final resize still has detail to work with.
+                # Other formats ignore this and decode at full size.
+                target_width, target_height = self.target_size
+                source.draft('RGB', (target_width * 2, target_height * 2))
+
+                # Convert to RGB if necessary
+                img = source.convert('RGB') if source.mode != 'RGB' else source
+
+                # Resize to fit preview area - the draft is already
+                # close to that size, so bilinear is enough
+                img.thumbnail(self.target_size, Image.Resampling.BILINEAR)
+
+                # Closing the source also discards its pixels - keep a copy of the preview
+                if img is source:
+                    img = img.copy()
+
+            if self.thumbnail_path is not None:
+                try:
+                    img.save(self.thumbnail_path, "JPEG", quality=constants.PREVIEW_THUMBNAIL_QUALITY)
+                    self.loaded.emit(self.request_id, self.thumbnail_path, None, "")
+                    return
+                except OSError:
+                    pass  # Cache not writable - send the decoded pixels instead
+
+            # 32-bit pixels in Qt's native RGB32 layout (see _on_preview_loaded)
+            pixels = (img.tobytes("raw", "BGRX"), img.width, img.height)
+            self.loaded.emit(self.request_id, None, pixels, "")
+
+        except Exception as e:
+            self.loaded.emit(self.request_id, None, None, str(e))
+
+
+# Light backgrounds for the Filter Reason column, so rows with the same reason group visually
+_REASON_COLORS = tuple(QColor(color) for color in (
+    "#fde2e2", "#e2eefd", "#e4f7e2", "#fdf3d9", "#efe2fd", "#dff4f4", "#f4e8dc",
+))
+
+
+# Item data roles FilteredFilesModel.data() answers. The view calls data() for every
+# visible cell and role on each repaint, so the enum members are looked up once here.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_BACKGROUND_ROLE = Qt.ItemDataRole.BackgroundRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+
+
+class FilteredFilesModel(QAbstractTableModel):
+    """
+    Table model over the filtered files list.
+
+    The view only asks for the rows it shows, so display strings are built for
+    visible rows on demand instead of creating table items for every file.
+    """
+
+    HEADERS = ("Filename", "Filter Reason", "Size", "Dimensions", "Path")
+
+    def __init__(self, format_size, parent=None):
+        """
+        Args:
+            format_size: Function formatting a size in bytes for display
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._format_size = format_size
+        self._files = []
+        self._rows = []  # Indices into _files of the rows shown, in order
+        self._all_rows = []  # Indices of all files
+        # The filter reason column is dictionary-encoded by set_files: each distinct
+        # reason is stored once in _reason_names and files refer to it by its code
+        self._reason_names = []  # Distinct filter reasons, sorted - index is the reason code
+        self._reason_lookup = {}  # Filter reason -> reason code
+        self._reason_codes = array('H')  # Reason code of each file, indexed like _files
+        self._by_reason = []  # Indices of the files of each reason code
+        self._reason_colors = []  # Background QColor of the Filter Reason cells, per reason code
+        # Display strings per file (not per shown row), built on first access and
+        # kept until set_files, so changing the reason filter does not rebuild them
+        self._file_text = []
+
+    def set_files(self, filtered_files):
+        """Replace the files list and show all of them."""
+        self.beginResetModel()
+        self._files = filtered_files
+        self._all_rows = list(range(len(filtered_files)))
+
+        reasons = [file_info.get('filter_reason', 'Unknown') for file_info in filtered_files]
+        # Interned, so the model holds one object per reason however the results were built
+        self._reason_names = [sys.intern(reason) if type(reason) is str else reason
+                              for reason in sorted(set(reasons), key=str)]
+        self._reason_lookup = {reason: code for code, reason in enumerate(self._reason_names)}
+        self._reason_codes = array('H', [self._reason_lookup[reason] for reason in reasons])
+        self._by_reason = [[] for _ in self._reason_names]
+        for i, code in enumerate(self._reason_codes):
+            self._by_reason[code].append(i)
+        self._reason_colors = [_REASON_COLORS[code % len(_REASON_COLORS)]
+                               for code in range(len(self._reason_names))]
+
+        self._rows = self._all_rows
+        self._file_text = [None] * len(filtered_files)
+        self.endResetModel()
+
+    def reason_counts(self):
+        """Get the distinct filter reasons of the files, sorted, with their file counts."""
+        return [(reason, len(rows)) for reason, rows in zip(self._reason_names, self._by_reason) if reason]
+
+    def set_reason(self, reason):
+        """
+        Show only the files filtered for one reason.
+
+        Args:
+            reason: Filter reason to show, or None for all files
+        """
+        self.beginResetModel()
+        if reason is None:
+            self._rows = self._all_rows
+        else:
+            code = self._reason_lookup.get(reason)
+            self._rows = self._by_reason[code] if code is not None else []
+        self.endResetModel()
+
+    def file_info(self, row):
+        """Get the file info dictionary shown in a row."""
+        return self._files[self._rows[row]]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE:
+            if not index.isValid():
+                return None
+            file_index = self._rows[index.row()]
+            text = self._file_text[file_index]
+            if text is None:
+                text = self._file_text[file_index] = self._build_row_text(file_index)
+            return text[index.column()]
+        if role == _BACKGROUND_ROLE:
+            if index.isValid() and index.column() == 1:
+                return self._reason_colors[self._reason_codes[self._rows[index.row()]]]
+            return None
+        if role == _USER_ROLE and index.isValid():
+            return self._files[self._rows[index.row()]]
+        return None
+
+    def _build_row_text(self, file_index):
+        """Build the display strings of one file, in column order."""
+        file_info = self._files[file_index]
+        file_path = file_info.get('file_path', '')
+        width = file_info.get('width', 0)
+        height = file_info.get('height', 0)
+        return (
+            os.path.basename(file_path),
+            self._reason_names[self._reason_codes[file_index]],
+            self._format_size(file_info.get('file_size', 0)),
+            f"{width} x {height}" if width and height else "N/A",
+            file_path,
+        )
+
+
+class ExportWorker(QThread):
+    """Worker thread that writes the filtered files list to a CSV or text file."""
+
+    progress = Signal(int)  # rows written
+    completed = Signal(int)  # total rows written
+    failed = Signal(str)  # error message
+
+    def __init__(self, file_path, filtered_files, format_size):
+        """
+        Args:
+            file_path: File to write - tab-separated text unless it ends with .csv
+            filtered_files: List of file info dictionaries to export
+            format_size: Function formatting a size in bytes for display
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.filtered_files = filtered_files
+        self.format_size = format_size
+        self._cancelled = False
+
+    def cancel(self):
+        """Stop the export at the next progress check and remove the partial file."""
+        self._cancelled = True
+
+    def _rows(self):
+        """Generate the export rows, one per file."""
+        format_size = self.format_size
+        for file_info in self.filtered_files:
+            width = file_info.get('width')
+            height = file_info.get('height')
+            yield (
+                os.path.basename(file_info.get('file_path', '')),
+                file_info.get('filter_reason', 'Unknown'),
+                format_size(file_info.get('file_size', 0)),
+                f"{width}x{height}" if width and height else "N/A",
+                file_info.get('file_path', ''),
+            )
+
+    def run(self):
+        """Write the export file (runs in background thread)."""
+        try:
+            written = 0
+            # csv quotes and escapes fields itself, so names containing quotes,
+            # commas or tabs stay in their column
+            with open(self.file_path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                if self.file_path.endswith('.csv'):
+                    writer = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator='\n')
+                else:
+                    writer = csv.writer(f, delimiter='\t', quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+
+                writer.writerow(("Filename", "Filter Reason", "Size", "Dimensions", "Path"))
+                rows = self._rows()
+                while not self._cancelled:
+                    chunk = list(itertools.islice(rows, constants.EXPORT_PROGRESS_INTERVAL))
+                    if not chunk:
+                        break
+                    writer.writerows(chunk)
+                    written += len(chunk)
+                    self.progress.emit(written)
+
+            if self._cancelled:
+                os.remove(self.file_path)
+            else:
+                self.completed.emit(written)
+
+        except Exception as e:
+            self.failed.emit(str(e))
 
 
 class FilteredFilesTab(QWidget):
@@ -24,6 +384,18 @@ class FilteredFilesTab(QWidget):
         super().__init__()
         self.filtered_files = []
         self.filter_statistics = {}
+        self._thumb_cache_dir = _thumbnail_cache_dir()
+        self._export_worker = None  # Running ExportWorker, kept alive until it finishes
+
+        # The preview is loaded once the selection has settled, see on_file_selected
+        self._pending_preview = None
+        self._preview_request_id = 0  # Results of older preview requests are ignored
+        self._preview_workers = set()  # Running PreviewLoadWorkers, kept alive until they finish
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(constants.PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._do_preview_update)
+
         self.init_ui()
 
     def init_ui(self):
@@ -73,11 +445,10 @@ class FilteredFilesTab(QWidget):
         left_layout = QVBoxLayout()
         left_widget.setLayout(left_layout)
 
-        self.files_table = QTableWidget()
-        self.files_table.setColumnCount(5)
-        self.files_table.setHorizontalHeaderLabels([
-            "Filename", "Filter Reason", "Size", "Dimensions", "Path"
-        ])
+        # A view over FilteredFilesModel - only the visible rows are ever built
+        self.files_model = FilteredFilesModel(self.format_file_size, self)
+        self.files_table = QTableView()
+        self.files_table.setModel(self.files_model)
 
         # Set column widths - all columns are user-resizable (Interactive mode)
         header = self.files_table.horizontalHeader()
@@ -94,8 +465,8 @@ class FilteredFilesTab(QWidget):
         header.setStretchLastSection(True)
 
         self.files_table.setAlternatingRowColors(True)
-        self.files_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.files_table.itemSelectionChanged.connect(self.on_file_selected)
+        self.files_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.files_table.selectionModel().selectionChanged.connect(self.on_file_selected)
 
         left_layout.addWidget(self.files_table)
 
@@ -129,7 +500,11 @@ class FilteredFilesTab(QWidget):
 
         self.preview_label = QLabel()
         self.preview_label.setAlignment(Qt.AlignCenter)
-        self.preview_label.setMinimumSize(400, 300)
+        # Preview size in device-independent pixels, from the font height so it follows
+        # the system font (about 400x300 with a 16 pixel line height)
+        line_height = self.fontMetrics().height()
+        self._preview_size = QSize(line_height * 25, line_height * 19)
+        self.preview_label.setMinimumSize(self._preview_size)
         self.preview_label.setStyleSheet("border: 1px solid #ccc; background-color: #f5f5f5;")
         self.preview_label.setText("No preview available")
         preview_layout.addWidget(self.preview_label)
@@ -184,17 +559,24 @@ class FilteredFilesTab(QWidget):
         self.filtered_files = filtered_files or []
         self.filter_statistics = filter_statistics or {}
 
-        # Update header
-        self.total_filtered_label.setText(f"Total Filtered: {len(self.filtered_files)}")
+        # Lay out and repaint once for all the updates below
+        self.setUpdatesEnabled(False)
+        try:
+            self.files_model.set_files(self.filtered_files)
 
-        # Update statistics
-        self.update_statistics_display()
+            # Update header
+            self.total_filtered_label.setText(f"Total Filtered: {len(self.filtered_files)}")
 
-        # Update reason dropdown
-        self.update_reason_combo()
+            # Update statistics
+            self.update_statistics_display()
 
-        # Populate table
-        self.populate_table()
+            # Update reason dropdown
+            self.update_reason_combo()
+
+            # Populate table
+            self.populate_table()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def update_statistics_display(self):
         """Update the statistics summary."""
@@ -210,6 +592,7 @@ class FilteredFilesTab(QWidget):
             ("By dimensions", self.filter_statistics.get('filtered_by_dimensions', 0)),
             ("By square icon detection", self.filter_statistics.get('filtered_by_square', 0)),
             ("By filename pattern", self.filter_statistics.get('filtered_by_filename', 0)),
+            ("By file extension", self.filter_statistics.get('filtered_by_extension', 0)),
             ("By missing EXIF", self.filter_statistics.get('filtered_by_exif', 0)),
             ("By aspect ratio", self.filter_statistics.get('filtered_by_aspect_ratio', 0)),
         ]
@@ -224,24 +607,24 @@ class FilteredFilesTab(QWidget):
 
     def update_reason_combo(self):
         """Update the filter reason dropdown."""
-        current_text = self.reason_combo.currentText()
-        self.reason_combo.clear()
-        self.reason_combo.addItem("All Reasons")
+        current_reason = self.reason_combo.currentData()
 
-        # Add unique reasons from filtered files
-        reasons = set()
-        for file_info in self.filtered_files:
-            reason = file_info.get('filter_reason', 'Unknown')
-            if reason:
-                reasons.add(reason)
+        # Blocked so clearing and refilling the dropdown does not repopulate the table
+        # for every intermediate selection - callers populate it once afterwards
+        with QSignalBlocker(self.reason_combo):
+            self.reason_combo.clear()
+            self.reason_combo.addItem(f"All Reasons ({len(self.filtered_files):,})")
 
-        for reason in sorted(reasons):
-            self.reason_combo.addItem(reason)
+            # Add unique reasons from filtered files, with their counts - the reason
+            # itself is the item data, see populate_table
+            for reason, count in self.files_model.reason_counts():
+                self.reason_combo.addItem(f"{reason} ({count:,})", reason)
 
-        # Restore previous selection if possible
-        index = self.reason_combo.findText(current_text)
-        if index >= 0:
-            self.reason_combo.setCurrentIndex(index)
+            # Restore previous selection if possible
+            if current_reason is not None:
+                index = self.reason_combo.findData(current_reason)
+                if index >= 0:
+                    self.reason_combo.setCurrentIndex(index)
 
     def filter_by_reason(self):
         """Filter the table by selected reason."""
@@ -249,52 +632,27 @@ class FilteredFilesTab(QWidget):
 
     def populate_table(self):
         """Populate the filtered files table."""
-        self.files_table.setRowCount(0)
+        # None for "All Reasons"
+        self.files_model.set_reason(self.reason_combo.currentData())
 
-        selected_reason = self.reason_combo.currentText()
+        # Resetting the model drops the selection without a selectionChanged signal
+        self.on_file_selected()
 
-        for file_info in self.filtered_files:
-            # Apply reason filter
-            reason = file_info.get('filter_reason', 'Unknown')
-            if selected_reason != "All Reasons" and reason != selected_reason:
-                continue
-
-            row = self.files_table.rowCount()
-            self.files_table.insertRow(row)
-
-            # Filename
-            file_path = file_info.get('file_path', '')
-            filename = os.path.basename(file_path)
-            self.files_table.setItem(row, 0, QTableWidgetItem(filename))
-
-            # Filter Reason
-            self.files_table.setItem(row, 1, QTableWidgetItem(reason))
-
-            # Size
-            size = file_info.get('file_size', 0)
-            size_str = self.format_file_size(size)
-            self.files_table.setItem(row, 2, QTableWidgetItem(size_str))
-
-            # Dimensions
-            width = file_info.get('width', 0)
-            height = file_info.get('height', 0)
-            if width and height:
-                dimensions = f"{width} x {height}"
-            else:
-                dimensions = "N/A"
-            self.files_table.setItem(row, 3, QTableWidgetItem(dimensions))
-
-            # Path
-            self.files_table.setItem(row, 4, QTableWidgetItem(file_path))
-
-            # Store full file info in first column
-            self.files_table.item(row, 0).setData(Qt.UserRole, file_info)
+    def _selected_file_info(self):
+        """Get the file info dictionary of the selected row, or None."""
+        rows = self.files_table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.files_model.file_info(rows[0].row())
 
     def on_file_selected(self):
         """Handle file selection to show details and preview."""
-        selected_items = self.files_table.selectedItems()
+        file_info = self._selected_file_info()
 
-        if not selected_items:
+        if not file_info:
+            self._preview_timer.stop()
+            self._pending_preview = None
+            self._preview_request_id += 1
             self.details_text.clear()
             self.preview_label.clear()
             self.preview_label.setText("No preview available")
@@ -303,16 +661,6 @@ class FilteredFilesTab(QWidget):
             self.copy_path_btn.setEnabled(False)
             return
 
-        # Get file info
-        row = selected_items[0].row()
-        first_item = self.files_table.item(row, 0)
-        if not first_item:
-            return
-
-        file_info = first_item.data(Qt.UserRole)
-        if not file_info:
-            return
-
         # Enable buttons
         self.open_file_btn.setEnabled(True)
         self.open_folder_btn.setEnabled(True)
@@ -321,8 +669,16 @@ class FilteredFilesTab(QWidget):
         # Display details
         self.display_file_details(file_info)
 
-        # Display preview
-        self.display_file_preview(file_info)
+        # Display preview once no other row has been selected for PREVIEW_DEBOUNCE_MS
+        self._pending_preview = file_info
+        self._preview_timer.start()
+
+    def _do_preview_update(self):
+        """Display the preview of the file selected last."""
+        file_info = self._pending_preview
+        self._pending_preview = None
+        if file_info:
+            self.display_file_preview(file_info)
 
     def display_file_details(self, file_info):
         """Display detailed file information."""
@@ -346,12 +702,15 @@ class FilteredFilesTab(QWidget):
             aspect_ratio = width / height
             details.append(f"Aspect Ratio:   {aspect_ratio:.2f}:1")
 
-        details.append(f"Format:         {file_info.get('format', 'Unknown')}")
-        details.append(f"Mode:           {file_info.get('mode', 'Unknown')}")
+        # Read once per file and kept on its entry
+        if 'format' not in file_info:
+            file_info['format'], file_info['mode'] = _image_format_and_mode(file_info.get('file_path', ''))
+        details.append(f"Format:         {file_info['format']}")
+        details.append(f"Mode:           {file_info['mode']}")
 
-        # EXIF data
-        has_exif = file_info.get('has_exif', False)
-        details.append(f"Has EXIF:       {'Yes' if has_exif else 'No'}")
+        # EXIF data - None when the filter did not need to check it
+        has_exif = file_info.get('has_exif')
+        details.append(f"Has EXIF:       {'Not checked' if has_exif is None else 'Yes' if has_exif else 'No'}")
 
         details.append("")
         details.append("FILTER CRITERIA")
@@ -368,42 +727,110 @@ class FilteredFilesTab(QWidget):
     def display_file_preview(self, file_info):
         """Display image preview if possible."""
         file_path = file_info.get('file_path', '')
+        self._preview_request_id += 1
 
-        if not os.path.exists(file_path):
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
             self.preview_label.clear()
             self.preview_label.setText("File not found")
             return
 
-        try:
-            # Try to load image with PIL
-            img = Image.open(file_path)
-
-            # Convert to RGB if necessary
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-
-            # Resize to fit preview area (max 400x300)
-            img.thumbnail((400, 300), Image.Resampling.LANCZOS)
-
-            # Convert PIL Image to QPixmap
-            img_data = img.tobytes("raw", "RGB")
-            qimage = QImage(img_data, img.width, img.height, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(qimage)
+        # Decode at the label's resolution in device pixels - sharp on high-DPI
+        # displays without decoding more than a standard display shows
+        ratio = self.preview_label.devicePixelRatioF()
+        target_size = (round(self._preview_size.width() * ratio), round(self._preview_size.height() * ratio))
+
+        # Previously shown files are cached as small JPEGs - no need to decode the original
+        thumbnail_path = None
+        if self._thumb_cache_dir is not None:
+            thumbnail_path = str(_thumbnail_cache_path(self._thumb_cache_dir, file_path, stat_result, target_size))
+            if os.path.exists(thumbnail_path):
+                pixmap = _load_thumbnail_pixmap(thumbnail_path)
+                if not pixmap.isNull():
+                    self._show_preview_pixmap(pixmap)
+                    return
+
+        # Decoding the original happens on a worker thread; _on_preview_loaded shows the result.
+        # Meanwhile JPEGs get a rough preview, decoded at 1/8 scale in a few milliseconds.
+        quick_pixmap = self._quick_preview(file_path, target_size)
+        if quick_pixmap is not None:
+            self._show_preview_pixmap(quick_pixmap)
+        else:
+            self.preview_label.clear()
+            self.preview_label.setText("Loading preview...")
+        worker = PreviewLoadWorker(self._preview_request_id, file_path, thumbnail_path, target_size)
+        worker.loaded.connect(self._on_preview_loaded)
+        worker.finished.connect(lambda: self._preview_workers.discard(worker))
+        self._preview_workers.add(worker)
+        worker.start()
+
+    def _show_preview_pixmap(self, pixmap):
+        """Show a preview pixmap decoded in device pixels at the label's logical size."""
+        pixmap.setDevicePixelRatio(self.preview_label.devicePixelRatioF())
+        self.preview_label.setPixmap(pixmap)
+
+    def _quick_preview(self, file_path, target_size):
+        """
+        Build a low-resolution preview of a JPEG, shown while the full preview loads.
 
-            self.preview_label.setPixmap(pixmap)
+        Args:
+            file_path: Image to preview
+            target_size: (width, height) in device pixels to scale the preview up to
 
-        except Exception as e:
+        Returns:
+            QPixmap scaled up to the preview size, or None if the file is not a
+            JPEG or could not be read
+        """
+        # Checked by name so other formats are never opened on the UI thread
+        if os.path.splitext(file_path)[1].lower() not in _QUICK_PREVIEW_EXTENSIONS:
+            return None
+
+        # With a scaled size set, Qt's JPEG reader decodes at reduced scale (scaled IDCT)
+        reader = QImageReader(file_path)
+        reader.setAutoTransform(True)  # Honor the EXIF orientation, like the full preview
+        size = reader.size()
+        if not size.isValid():
+            return None
+        if size.width() > 64 or size.height() > 48:
+            size.scale(64, 48, Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+        image = reader.read()
+        if image.isNull():
+            return None
+        pixmap = QPixmap.fromImage(image)
+        return pixmap.scaled(target_size[0], target_size[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    def _on_preview_loaded(self, request_id, thumbnail_path, pixels, error):
+        """Show a preview decoded by PreviewLoadWorker."""
+        if request_id != self._preview_request_id:
+            return  # Another file was selected while this one loaded
+
+        pixmap = None
+        if thumbnail_path is not None:
+            pixmap = _load_thumbnail_pixmap(thumbnail_path)
+        elif isinstance(pixels, QImage):
+            pixmap = QPixmap.fromImage(pixels)
+        elif pixels is not None:
+            # The QImage only wraps the pixel bytes, which stay alive for the
+            # fromImage call. RGB32 rows are 4-byte aligned and are the pixmap's own
+            # format, so fromImage makes its one copy without converting.
+            data, width, height = pixels
+            pixmap = QPixmap.fromImage(QImage(data, width, height, width * 4, QImage.Format_RGB32))
+
+        if pixmap is not None and not pixmap.isNull():
+            self._show_preview_pixmap(pixmap)
+        else:
             self.preview_label.clear()
-            self.preview_label.setText(f"Preview not available\n{str(e)}")
+            self.preview_label.setText(f"Preview not available\n{error}")
 
     def open_selected_file(self):
         """Open the selected file with default application."""
-        selected_items = self.files_table.selectedItems()
-        if not selected_items:
+        file_info = self._selected_file_info()
+        if not file_info:
             return
 
-        row = selected_items[0].row()
-        file_path = self.files_table.item(row, 4).text()
+        file_path = file_info.get('file_path', '')
 
         if not os.path.exists(file_path):
             QMessageBox.warning(self, "File Not Found",
@@ -415,6 +842,7 @@ class FilteredFilesTab(QWidget):
             if os.name == 'nt':  # Windows
                 os.startfile(file_path)
             elif os.name == 'posix':  # Linux/Mac
+                import subprocess
                 subprocess.run(['xdg-open', file_path], check=False)
 
         except Exception as e:
@@ -423,12 +851,11 @@ class FilteredFilesTab(QWidget):
 
     def open_file_folder(self):
         """Open the folder containing the selected file."""
-        selected_items = self.files_table.selectedItems()
-        if not selected_items:
+        file_info = self._selected_file_info()
+        if not file_info:
             return
 
-        row = selected_items[0].row()
-        file_path = self.files_table.item(row, 4).text()
+        file_path = file_info.get('file_path', '')
 
         folder_path = os.path.dirname(file_path)
 
@@ -442,6 +869,7 @@ class FilteredFilesTab(QWidget):
             if os.name == 'nt':  # Windows
                 os.startfile(folder_path)
             elif os.name == 'posix':  # Linux/Mac
+                import subprocess
                 subprocess.run(['xdg-open', folder_path], check=False)
 
         except Exception as e:
@@ -450,12 +878,11 @@ class FilteredFilesTab(QWidget):
 
     def copy_file_path(self):
         """Copy the selected file path to clipboard."""
-        selected_items = self.files_table.selectedItems()
-        if not selected_items:
+        file_info = self._selected_file_info()
+        if not file_info:
             return
 
-        row = selected_items[0].row()
-        file_path = self.files_table.item(row, 4).text()
+        file_path = file_info.get('file_path', '')
 
         clipboard = QApplication.clipboard()
         clipboard.setText(file_path)
@@ -479,47 +906,43 @@ class FilteredFilesTab(QWidget):
         if not file_path:
             return
 
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                # Write header
-                if file_path.endswith('.csv'):
-                    f.write('"Filename","Filter Reason","Size","Dimensions","Path"\n')
-                else:
-                    f.write("Filename\tFilter Reason\tSize\tDimensions\tPath\n")
-
-                # Write data
-                for file_info in self.filtered_files:
-                    filename = os.path.basename(file_info.get('file_path', ''))
-                    reason = file_info.get('filter_reason', 'Unknown')
-                    size = self.format_file_size(file_info.get('file_size', 0))
-                    width = file_info.get('width', 0)
-                    height = file_info.get('height', 0)
-                    dimensions = f"{width}x{height}" if width and height else "N/A"
-                    path = file_info.get('file_path', '')
-
-                    if file_path.endswith('.csv'):
-                        f.write(f'"{filename}","{reason}","{size}","{dimensions}","{path}"\n')
-                    else:
-                        f.write(f"{filename}\t{reason}\t{size}\t{dimensions}\t{path}\n")
-
-            QMessageBox.information(self, "Export Successful",
-                                   f"Exported {len(self.filtered_files)} filtered files to:\n{file_path}")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Export Failed",
-                               f"Failed to export:\n{str(e)}")
+        # The file is written on a worker thread; the progress dialog can cancel it
+        progress = QProgressDialog("Exporting filtered files...", "Cancel",
+                                   0, len(self.filtered_files), self)
+        progress.setWindowTitle("Export Filtered Files")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)
+
+        worker = ExportWorker(file_path, self.filtered_files, self.format_file_size)
+        worker.progress.connect(progress.setValue)
+        progress.canceled.connect(worker.cancel)
+        worker.completed.connect(
+            lambda count: QMessageBox.information(
+                self, "Export Successful",
+                f"Exported {count} filtered files to:\n{file_path}"))
+        worker.failed.connect(
+            lambda error: QMessageBox.critical(
+                self, "Export Failed",
+                f"Failed to export:\n{error}"))
+        worker.finished.connect(progress.close)
+        worker.finished.connect(self._on_export_finished)
+
+        self._export_worker = worker
+        self.export_btn.setEnabled(False)
+        worker.start()
+
+    def _on_export_finished(self):
+        """Re-enable exporting once the export worker has finished."""
+        self._export_worker = None
+        self.export_btn.setEnabled(True)
+
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
     def format_file_size(self, size_bytes):
         """Format file size in human-readable format."""
-        if size_bytes == 0:
+        if size_bytes <= 0:
             return "0 B"
 
-        units = ['B', 'KB', 'MB', 'GB', 'TB']
-        unit_index = 0
-        size = float(size_bytes)
-
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-
-        return f"{size:.2f} {units[unit_index]}"
+        # Each unit is 2**10 times the previous one, so the unit follows from the bit length
+        unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(self._SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (unit_index * 10)):.2f} {self._SIZE_UNITS[unit_index]}"
@@ -5,13 +5,14 @@ View detailed application logs within UI with advanced filtering and analysis.
 """
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-                               QTableWidget, QTableWidgetItem, QComboBox,
+                               QTableView, QAbstractItemView, QComboBox,
                                QLineEdit, QPushButton, QLabel, QCheckBox,
                                QHeaderView, QTextEdit, QFileDialog, QMessageBox,
                                QApplication, QSplitter)
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor, QFont
 import os
+import re
 import glob
 from datetime import datetime, timedelta
 
@@ -26,6 +27,104 @@ class ClickableLabel(QLabel):
         super().mousePressEvent(event)
 
 
+# Log levels counted in the statistics bar
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+
+# One line of the utils.setup_logger format:
+# timestamp - name - module - LEVEL - function - line --- message
+# The module shown is the first field before the level (the logger name)
+_LOG_RE = re.compile(
+    r'(?P<ts>\d{4}-\d\d-\d\d \d\d:\d\d:\d\d,\d+) - (?P<mod>[^ ]+)(?: - [^ ]+)? - '
+    r'(?P<lvl>DEBUG|INFO|WARNING|ERROR|CRITICAL) - (?P<fn>[^ ]+) - (?P<ln>\d+) --- \s*(?P<msg>.*)'
+)
+
+# Row colors by log level - created once and shared by every row of that level
+_LEVEL_BACKGROUNDS = {
+    'WARNING': QColor(255, 243, 205),  # Light yellow
+    'ERROR': QColor(248, 215, 218),  # Light red
+    'CRITICAL': QColor(220, 53, 69),  # Red
+}
+_LEVEL_FOREGROUNDS = {
+    'CRITICAL': QColor(255, 255, 255),  # White text on the red background
+}
+
+
+class LogModel(QAbstractTableModel):
+    """
+    Table model over the parsed log entries.
+
+    Holds the entries and the indices of those that pass the filters; the view
+    only asks for the rows it shows, so no table items are created per entry.
+    """
+
+    HEADERS = ("Timestamp", "Level", "Module", "Function", "Line", "Message")
+    FIELDS = ('timestamp', 'level', 'module', 'function', 'line', 'message')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._rows = []  # Indices into _entries of the rows shown, in order
+
+    def set_rows(self, entries, rows):
+        """
+        Show a new set of entries.
+
+        Args:
+            entries: List of parsed log entry dictionaries
+            rows: Indices into entries of the entries to show, in order
+        """
+        self.beginResetModel()
+        self._entries = entries
+        self._rows = rows
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """
+        Show more entries after the current rows.
+
+        Args:
+            rows: Indices into the entries list of the entries to add, in order
+        """
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def entry(self, row):
+        """Get the log entry dictionary shown in a row."""
+        return self._entries[self._rows[row]]
+
+    def row_text(self, row):
+        """Get the displayed text of a row, in column order."""
+        entry = self._entries[self._rows[row]]
+        return [entry[field] for field in self.FIELDS]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[self._rows[index.row()]]
+        if role == Qt.DisplayRole:
+            return entry[self.FIELDS[index.column()]]
+        if role == Qt.BackgroundRole:
+            return _LEVEL_BACKGROUNDS.get(entry['level'])
+        if role == Qt.ForegroundRole:
+            return _LEVEL_FOREGROUNDS.get(entry['level'])
+        if role == Qt.UserRole:
+            return entry
+        return None
+
+
 class LogsTab(QWidget):
     """Tab for viewing application logs with advanced features."""
 
@@ -35,6 +134,12 @@ class LogsTab(QWidget):
         self.available_log_files = []
         self.auto_scroll = True
         self.all_log_entries = []  # Store all parsed entries
+        self._level_counts = dict.fromkeys(LOG_LEVELS, 0)
+
+        # Tail state - refreshes read only what was appended since the last one
+        self._last_offset = 0  # Bytes of the log file already read
+        self._last_inode = None  # Detects the file being replaced (rotation)
+        self._pending = b''  # Partial last line, completed by the next read
         self.init_ui()
 
         # Discover log files
@@ -165,11 +270,10 @@ class LogsTab(QWidget):
         # Splitter for table and details panel
         splitter = QSplitter(Qt.Vertical)
 
-        # Log viewer table
-        self.log_table = QTableWidget()
-        self.log_table.setColumnCount(6)
-        self.log_table.setHorizontalHeaderLabels(
-            ["Timestamp", "Level", "Module", "Function", "Line", "Message"])
+        # Log viewer table - a view over LogModel, which builds only the visible rows
+        self.log_model = LogModel(self)
+        self.log_table = QTableView()
+        self.log_table.setModel(self.log_model)
 
         # Set column widths
         header = self.log_table.horizontalHeader()
@@ -181,8 +285,8 @@ class LogsTab(QWidget):
         header.setSectionResizeMode(5, QHeaderView.Stretch)
 
         self.log_table.setAlternatingRowColors(True)
-        self.log_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.log_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.log_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.log_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
 
         splitter.addWidget(self.log_table)
 
@@ -236,6 +340,7 @@ class LogsTab(QWidget):
         """Handle log file selection change."""
         if log_file and log_file != "No log files found":
             self.current_log_file = log_file
+            self._reset_tail()
             self.clear_display()
             self.refresh_logs()
 
@@ -245,39 +350,116 @@ class LogsTab(QWidget):
             return
 
         try:
-            with open(self.current_log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-
-            # Clear and reload all entries
-            self.all_log_entries = []
-
-            # Parse all log lines
-            for line in lines:
-                entry = self._parse_log_line(line)
-                if entry:
-                    self.all_log_entries.append(entry)
-
-            # Update statistics
-            self.update_statistics()
-
-            # Apply filters and display
-            self.filter_logs()
+            st = os.stat(self.current_log_file)
+
+            # A smaller or different file was truncated or rotated - read it from the start
+            reload = st.st_size < self._last_offset or st.st_ino != self._last_inode
+            if reload:
+                self._reset_tail()
+                self._clear_entries()
+                self._last_inode = st.st_ino
+
+            # Read only the bytes appended since the last refresh
+            with open(self.current_log_file, 'rb') as f:
+                f.seek(self._last_offset)
+                data = f.read()
+            self._last_offset += len(data)
+
+            # Keep an unfinished last line for the next refresh
+            data, newline, self._pending = (self._pending + data).rpartition(b'\n')
+
+            # Parse the new log lines
+            first_new = len(self.all_log_entries)
+            if newline:
+                for line in data.decode('utf-8', errors='ignore').split('\n'):
+                    entry = self._parse_log_line(line)
+                    if entry:
+                        self.all_log_entries.append(entry)
+                        if entry['level'] in self._level_counts:
+                            self._level_counts[entry['level']] += 1
+
+            # A reload zeroed the counts, so show them even if no complete line was read yet
+            if reload or len(self.all_log_entries) > first_new:
+                self.update_statistics()
+
+            # Apply filters and display - the time range moves with the clock, so
+            # it is re-applied to every entry; otherwise only new entries are added
+            if reload or self._time_threshold() is not None:
+                self.filter_logs()
+            else:
+                self._append_filtered(first_new)
 
         except Exception as e:
             print(f"Error reading log file: {e}")
 
+    def _reset_tail(self):
+        """Forget the read position so the next refresh reads the log file from the start."""
+        self._last_offset = 0
+        self._last_inode = None
+        self._pending = b''
+
+    def _clear_entries(self):
+        """Drop all parsed entries and their level counts."""
+        self.all_log_entries = []
+        self._level_counts = dict.fromkeys(LOG_LEVELS, 0)
+
     def _parse_log_line(self, line):
         """
         Parse a log line and return a dictionary.
 
+        Lines in the application's log format are matched by one compiled regex;
+        anything else goes to the slower split parser.
+        """
+        # First, check if this line contains ' --- ' which separates metadata from message
+        if ' --- ' not in line:
+            return None
+
+        line = line.strip()
+        match = _LOG_RE.match(line)
+        if match:
+            entry = {
+                'timestamp': match['ts'],
+                'level': match['lvl'],
+                'module': match['mod'],
+                'function': match['fn'],
+                'line': match['ln'],
+                'message': match['msg'],
+                'raw': line
+            }
+        else:
+            entry = self._parse_log_line_split(line)
+            if entry is None:
+                return None
+
+        # Parsed once here so the time range filter only compares datetimes
+        entry['ts_dt'] = self._parse_timestamp(entry['timestamp'])
+
+        # Lowercased once here so each search keystroke is only a substring test
+        entry['search_text'] = f"{entry['timestamp']} {entry['level']} {entry['module']} {entry['function']} {entry['message']}".lower()
+        return entry
+
+    @staticmethod
+    def _parse_timestamp(timestamp):
+        """
+        Convert a log timestamp (2024-01-02 15:30:45,123) to a datetime.
+
+        Slices the fixed-width fields directly, which is much faster than strptime.
+        Milliseconds are ignored. Returns None if the timestamp is not in this format.
+        """
+        try:
+            return datetime(int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+                            int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]))
+        except ValueError:
+            return None
+
+    def _parse_log_line_split(self, line):
+        """
+        Parse a log line the regex did not match and return a dictionary.
+
         Handles variable log formats by finding the log level in the parts.
         Expected levels: DEBUG, INFO, WARNING, ERROR, CRITICAL
         """
         try:
-            # First, check if this line contains ' --- ' which separates metadata from message
-            if ' --- ' not in line:
-                return None
-
             # Split into metadata and message parts
             metadata_part, message = line.split(' --- ', 1)
 
@@ -339,22 +521,9 @@ class LogsTab(QWidget):
             # If parsing fails, silently skip (don't spam console)
             return None
 
-    def filter_logs(self):
-        """Filter logs by level, search text, and time range."""
-        level_filter = self.level_combo.currentText()
-        search_text = self.search_box.text().lower()
+    def _time_threshold(self):
+        """Get the oldest time shown by the time range filter, or None to show all."""
         time_range = self.time_range_combo.currentText()
-
-        # Save current selection (by raw log line)
-        selected_entry = None
-        selected_items = self.log_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            first_item = self.log_table.item(row, 0)
-            if first_item:
-                selected_entry = first_item.data(Qt.UserRole)
-
-        # Calculate time threshold
         time_threshold = None
         now = datetime.now()
 
@@ -372,11 +541,25 @@ class LogsTab(QWidget):
             yesterday = now - timedelta(days=1)
             time_threshold = yesterday.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        # Clear table
-        self.log_table.setRowCount(0)
+        return time_threshold
+
+    def _matching_rows(self, start=0):
+        """
+        Get the indices of the entries that pass the level, search and time filters.
+
+        Args:
+            start: Index of the first entry to check
+
+        Returns:
+            list: Indices into all_log_entries, in order
+        """
+        level_filter = self.level_combo.currentText()
+        search_text = self.search_box.text().lower()
+        time_threshold = self._time_threshold()
 
-        # Filter and display entries
-        for entry in self.all_log_entries:
+        rows = []
+        for index in range(start, len(self.all_log_entries)):
+            entry = self.all_log_entries[index]
             show_entry = True
 
             # Level filter
@@ -384,94 +567,70 @@ class LogsTab(QWidget):
                 show_entry = False
 
             # Search filter
-            if show_entry and search_text:
-                entry_text = f"{entry['timestamp']} {entry['level']} {entry['module']} {entry['function']} {entry['message']}".lower()
-                if search_text not in entry_text:
-                    show_entry = False
+            if show_entry and search_text and search_text not in entry['search_text']:
+                show_entry = False
 
             # Time range filter
+            # If the timestamp could not be parsed, show the entry
             if show_entry and time_threshold:
-                try:
-                    # Parse timestamp (format: 2024-01-02 15:30:45,123)
-                    timestamp_str = entry['timestamp'].split(',')[0]  # Remove milliseconds
-                    entry_time = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-
-                    if entry_time < time_threshold:
-                        show_entry = False
-                except:
-                    # If timestamp parsing fails, show the entry
-                    pass
+                entry_time = entry['ts_dt']
+                if entry_time is not None and entry_time < time_threshold:
+                    show_entry = False
 
             if show_entry:
-                self._add_entry_to_table(entry)
+                rows.append(index)
+
+        return rows
+
+    def _append_filtered(self, start):
+        """Add the entries from start on that pass the filters to the table."""
+        rows = self._matching_rows(start)
+        if not rows:
+            return
+
+        self.log_model.append_rows(rows)
+
+        # Only auto-scroll if no selection (user isn't reading something)
+        if self.auto_scroll and not self.log_table.selectionModel().hasSelection():
+            self.log_table.scrollToBottom()
+
+    def filter_logs(self):
+        """Filter logs by level, search text, and time range."""
+        # Save current selection (by raw log line)
+        selected_entry = self._selected_entry()
+
+        # Filter entries
+        rows = self._matching_rows()
+
+        # Display the filtered entries - one model reset, colored by LogModel
+        self.log_model.set_rows(self.all_log_entries, rows)
 
         # Restore selection if we had one
         if selected_entry:
-            for row in range(self.log_table.rowCount()):
-                first_item = self.log_table.item(row, 0)
-                if first_item:
-                    entry = first_item.data(Qt.UserRole)
-                    if entry and entry['raw'] == selected_entry['raw']:
-                        # Found the same entry, restore selection
-                        self.log_table.selectRow(row)
-                        # Don't auto-scroll if we're restoring a selection
-                        break
+            for row, index in enumerate(rows):
+                if self.all_log_entries[index]['raw'] == selected_entry['raw']:
+                    # Found the same entry, restore selection
+                    self.log_table.selectRow(row)
+                    # Don't auto-scroll if we're restoring a selection
+                    break
         else:
             # Only auto-scroll if no selection (user isn't reading something)
             if self.auto_scroll:
                 self.log_table.scrollToBottom()
 
-    def _add_entry_to_table(self, entry):
-        """Add a log entry to the table."""
-        row = self.log_table.rowCount()
-        self.log_table.insertRow(row)
-
-        # Set items
-        self.log_table.setItem(row, 0, QTableWidgetItem(entry['timestamp']))
-        self.log_table.setItem(row, 1, QTableWidgetItem(entry['level']))
-        self.log_table.setItem(row, 2, QTableWidgetItem(entry['module']))
-        self.log_table.setItem(row, 3, QTableWidgetItem(entry['function']))
-        self.log_table.setItem(row, 4, QTableWidgetItem(entry['line']))
-        self.log_table.setItem(row, 5, QTableWidgetItem(entry['message']))
-
-        # Store full entry in first column's data
-        self.log_table.item(row, 0).setData(Qt.UserRole, entry)
-
-        # Color code by level
-        color = None
-        if entry['level'] == 'WARNING':
-            color = QColor(255, 243, 205)  # Light yellow
-        elif entry['level'] == 'ERROR':
-            color = QColor(248, 215, 218)  # Light red
-        elif entry['level'] == 'CRITICAL':
-            color = QColor(220, 53, 69)  # Red
-            # Make text white for critical
-            for col in range(6):
-                item = self.log_table.item(row, col)
-                if item:
-                    item.setForeground(QColor(255, 255, 255))
-
-        if color:
-            for col in range(6):
-                item = self.log_table.item(row, col)
-                if item:
-                    item.setBackground(color)
+        # Resetting the model drops the selection without a selectionChanged signal
+        self.on_selection_changed()
 
-    def update_statistics(self):
-        """Update log statistics display."""
-        counts = {
-            'DEBUG': 0,
-            'INFO': 0,
-            'WARNING': 0,
-            'ERROR': 0,
-            'CRITICAL': 0
-        }
-
-        for entry in self.all_log_entries:
-            level = entry['level']
-            if level in counts:
-                counts[level] += 1
+    def _selected_entry(self):
+        """Get the log entry of the first selected row, or None."""
+        rows = self.log_table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.log_model.entry(rows[0].row())
 
+    def update_statistics(self):
+        """Update log statistics display from the level counts kept while parsing."""
+        counts = self._level_counts
         self.stats_debug.setText(f"DEBUG: {counts['DEBUG']}")
         self.stats_info.setText(f"INFO: {counts['INFO']}")
         self.stats_warning.setText(f"WARNING: {counts['WARNING']}")
@@ -485,42 +644,33 @@ class LogsTab(QWidget):
 
     def on_selection_changed(self):
         """Handle log entry selection to show details."""
-        selected_items = self.log_table.selectedItems()
+        entry = self._selected_entry()
 
-        if not selected_items:
+        if not entry:
             self.details_text.clear()
             return
 
-        # Get the first column of the selected row to retrieve full entry
-        row = selected_items[0].row()
-        first_item = self.log_table.item(row, 0)
-
-        if first_item:
-            entry = first_item.data(Qt.UserRole)
-            if entry:
-                # Build detailed view
-                details = []
-                details.append("=" * 80)
-                details.append(f"TIMESTAMP:  {entry['timestamp']}")
-                details.append(f"LEVEL:      {entry['level']}")
-                details.append(f"MODULE:     {entry['module']}")
-                details.append(f"FUNCTION:   {entry['function']}")
-                details.append(f"LINE:       {entry['line']}")
-                details.append("=" * 80)
-                details.append("MESSAGE:")
-                details.append(entry['message'])
-                details.append("=" * 80)
-                details.append("RAW LOG LINE:")
-                details.append(entry['raw'])
-                details.append("=" * 80)
-
-                self.details_text.setPlainText("\n".join(details))
+        # Build detailed view
+        details = []
+        details.append("=" * 80)
+        details.append(f"TIMESTAMP:  {entry['timestamp']}")
+        details.append(f"LEVEL:      {entry['level']}")
+        details.append(f"MODULE:     {entry['module']}")
+        details.append(f"FUNCTION:   {entry['function']}")
+        details.append(f"LINE:       {entry['line']}")
+        details.append("=" * 80)
+        details.append("MESSAGE:")
+        details.append(entry['message'])
+        details.append("=" * 80)
+        details.append("RAW LOG LINE:")
+        details.append(entry['raw'])
+        details.append("=" * 80)
+
+        self.details_text.setPlainText("\n".join(details))
 
     def copy_selected_rows(self):
         """Copy selected rows to clipboard."""
-        selected_rows = set()
-        for item in self.log_table.selectedItems():
-            selected_rows.add(item.row())
+        selected_rows = {index.row() for index in self.log_table.selectionModel().selectedRows()}
 
         if not selected_rows:
             QMessageBox.information(self, "No Selection", "Please select rows to copy.")
@@ -529,12 +679,7 @@ class LogsTab(QWidget):
         # Build text to copy
         lines = []
         for row in sorted(selected_rows):
-            row_data = []
-            for col in range(self.log_table.columnCount()):
-                item = self.log_table.item(row, col)
-                if item:
-                    row_data.append(item.text())
-            lines.append("\t".join(row_data))
+            lines.append("\t".join(self.log_model.row_text(row)))
 
         # Copy to clipboard
         clipboard = QApplication.clipboard()
@@ -545,7 +690,8 @@ class LogsTab(QWidget):
 
     def export_logs(self):
         """Export filtered logs to file."""
-        if self.log_table.rowCount() == 0:
+        row_count = self.log_model.rowCount()
+        if row_count == 0:
             QMessageBox.warning(self, "No Data", "No logs to export.")
             return
 
@@ -562,9 +708,7 @@ class LogsTab(QWidget):
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 # Write header
-                headers = []
-                for col in range(self.log_table.columnCount()):
-                    headers.append(self.log_table.horizontalHeaderItem(col).text())
+                headers = LogModel.HEADERS
 
                 if file_path.endswith('.csv'):
                     f.write(",".join(f'"{h}"' for h in headers) + "\n")
@@ -572,16 +716,13 @@ class LogsTab(QWidget):
                     f.write("\t".join(headers) + "\n")
 
                 # Write rows
-                for row in range(self.log_table.rowCount()):
+                for row in range(row_count):
                     row_data = []
-                    for col in range(self.log_table.columnCount()):
-                        item = self.log_table.item(row, col)
-                        if item:
-                            text = item.text()
-                            if file_path.endswith('.csv'):
-                                # Escape quotes and wrap in quotes for CSV
-                                text = f'"{text.replace(chr(34), chr(34)+chr(34))}"'
-                            row_data.append(text)
+                    for text in self.log_model.row_text(row):
+                        if file_path.endswith('.csv'):
+                            # Escape quotes and wrap in quotes for CSV
+                            text = f'"{text.replace(chr(34), chr(34)+chr(34))}"'
+                        row_data.append(text)
 
                     if file_path.endswith('.csv'):
                         f.write(",".join(row_data) + "\n")
@@ -589,7 +730,7 @@ class LogsTab(QWidget):
                         f.write("\t".join(row_data) + "\n")
 
             QMessageBox.information(self, "Export Successful",
-                                   f"Exported {self.log_table.rowCount()} log entries to:\n{file_path}")
+                                   f"Exported {row_count} log entries to:\n{file_path}")
 
         except Exception as e:
             QMessageBox.critical(self, "Export Failed",
@@ -597,8 +738,8 @@ class LogsTab(QWidget):
 
     def clear_display(self):
         """Clear the display (not the log file)."""
-        self.log_table.setRowCount(0)
-        self.all_log_entries = []
+        self._clear_entries()
+        self.log_model.set_rows(self.all_log_entries, [])
         self.details_text.clear()
         self.update_statistics()
 
@@ -624,7 +765,8 @@ class LogsTab(QWidget):
                 with open(self.current_log_file, 'w') as f:
                     f.write('')
 
-                # Clear display
+                # Clear display and read the emptied file from the start
+                self._reset_tail()
                 self.clear_display()
 
                 QMessageBox.information(self, "Log File Cleared",
@@ -91,6 +91,7 @@ class MainWindow(QMainWindow):
         self.setup_tab.start_clicked.connect(self.start_processing)
         self.setup_tab.stop_clicked.connect(self.stop_processing)
         self.database_tab.database_changed.connect(self.on_database_changed)
+        self.database_tab.status_message.connect(self.status_bar.showMessage)
 
     def _create_menu_bar(self):
         """Create the menu bar."""
@@ -208,10 +209,8 @@ class MainWindow(QMainWindow):
         self.setup_tab.set_controls_enabled(True)
         self.status_bar.showMessage("Processing complete")
 
-        # Refresh database photo count from UniquePhotos table
+        # Refresh the database tab display - it recounts photos from the UniquePhotos table
         if self.database_metadata:
-            self.database_metadata.refresh_total_photos()
-            # Refresh the database tab display to show updated count
             self.database_tab.refresh_database_info()
 
         # Update results tab
@@ -74,6 +74,8 @@ class ProcessingWorker(QThread):
             self.status_update.emit("info", "Processing files and organizing...")
 
             final_results = self._organize_files(files)
+            if final_results.get('error'):
+                raise RuntimeError(final_results['error'])
 
             # Compile final results
             processing_time = time.time() - self.start_time
@@ -5,9 +5,35 @@ This module contains common functions used across multiple modules to reduce
 code duplication and maintain consistency.
 """
 
+import filecmp
 import logging
 import os
 import sys
+import time
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Logging formatter that formats each second's timestamp only once.
+
+    The default formatTime calls time.strftime for every record. The per-file loops log
+    several lines per file, so the formatted seconds are cached and only the
+    milliseconds are filled in per record. Output matches logging.Formatter.
+    """
+
+    # (whole second, formatted string) - one tuple so threads never see a mismatched pair
+    _cached_second = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, formatted = self._cached_second
+        if second != cached_second:
+            formatted = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_second = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
 
 
 def setup_logger(name, log_file, level=logging.DEBUG):
@@ -31,7 +57,7 @@ def setup_logger(name, log_file, level=logging.DEBUG):
         return logger
 
     # Create formatter
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         '%(asctime)s - %(name)s - %(module)s - %(levelname)s - %(funcName)s - %(lineno)d --- %(message)s'
     )
 
@@ -64,7 +90,8 @@ def ensure_directory_exists(folder_path):
     """
     try:
         if not os.path.exists(folder_path):
-            os.makedirs(folder_path)
+            # exist_ok: another worker thread may create the same folder concurrently
+            os.makedirs(folder_path, exist_ok=True)
             logging.info(f"Created missing directories for path: {folder_path}")
             return True
         else:
@@ -191,6 +218,59 @@ def safe_get_file_size(file_path):
         return None
 
 
+def head_tail_equal(file_a, file_b, num_bytes=4096):
+    """
+    Compare the first and last num_bytes of two files of the same size.
+
+    Parameters:
+        file_a (str): Path to the first file
+        file_b (str): Path to the second file
+        num_bytes (int): Number of bytes to compare at each end (default: 4KB)
+
+    Returns:
+        bool: True if both the head and the tail blocks are identical
+    """
+    with open(file_a, 'rb') as fa, open(file_b, 'rb') as fb:
+        if fa.read(num_bytes) != fb.read(num_bytes):
+            return False
+        size = os.fstat(fa.fileno()).st_size
+        if size > num_bytes:
+            tail_start = max(num_bytes, size - num_bytes)
+            fa.seek(tail_start)
+            fb.seek(tail_start)
+            if fa.read(num_bytes) != fb.read(num_bytes):
+                return False
+    return True
+
+
+def files_equal(file_a, file_b):
+    """
+    Determine if two files are identical, rejecting different files as cheaply as possible.
+
+    Files with different sizes are different. Files whose first or last
+    constants.COMPARE_HEAD_TAIL_BYTES (64KB) differ are different. Files that pass both
+    checks are confirmed with a full byte-by-byte comparison with filecmp, so a True
+    result is never a guess.
+
+    Parameters:
+        file_a (str): Path to the first file
+        file_b (str): Path to the second file
+
+    Returns:
+        bool: True if the files are identical, False otherwise
+    """
+    import constants
+    stat_a = os.stat(file_a)
+    stat_b = os.stat(file_b)
+    if stat_a.st_size != stat_b.st_size:
+        return False
+
+    if not head_tail_equal(file_a, file_b, constants.COMPARE_HEAD_TAIL_BYTES):
+        return False
+
+    return filecmp.cmp(file_a, file_b, shallow=False)
+
+
 def is_video_file(file_path):
     """
     Determine if a file is a video based on its extension.